@@ -215,24 +215,19 @@ class BuildAnalyzer:
         Analyze essence usage across all builds to identify meta trends,
         overused/underused essences, and balance insights.
         """
-        usage: Dict[str, int] = {}
-        cooccurrence: Dict[Tuple[str, str], int] = {}
-
-        for builds in self.loader.builds.values():
-            for build in builds:
-                build_essences = set()
-                for m in build.get("memories", []):
-                    for e in m.get("essences", []):
-                        usage[e] = usage.get(e, 0) + 1
-                        build_essences.add(e)
-
-                # Track which essences appear together
-                sorted_ess = sorted(build_essences)
-                for i, e1 in enumerate(sorted_ess):
-                    for e2 in sorted_ess[i + 1:]:
-                        pair = (e1, e2)
-                        cooccurrence[pair] = cooccurrence.get(pair, 0) + 1
-
+        report = self.essence_meta_report_basic()
+        # Keep the pairs ahead of the rarity breakdown in the output
+        usage_by_rarity = report.pop("usage_by_rarity")
+        report["most_common_pairs"] = self.essence_meta_report_pairs()
+        report["usage_by_rarity"] = usage_by_rarity
+        return report
+
+    def essence_meta_report_basic(self) -> Dict:
+        """
+        Essence usage counts, unused essences and the rarity breakdown,
+        without the (more expensive) co-occurrence pairs.
+        """
+        usage = self.loader.essence_usage_counts
         total_builds = sum(len(b) for b in self.loader.builds.values())
         all_essence_names = {e["name"] for e in self.loader.essences}
 
@@ -242,13 +237,11 @@ class BuildAnalyzer:
         # Unused
         unused = sorted(all_essence_names - set(usage.keys()))
 
-        # Most common pairs (emergent synergies)
-        sorted_pairs = sorted(cooccurrence.items(), key=lambda x: x[1], reverse=True)
-
         # Usage by rarity
+        rarity_map = self.loader.essence_rarity_map
         rarity_usage: Dict[str, Dict[str, int]] = {}
         for ess_name, count in usage.items():
-            rarity = self.loader.essence_rarity_map.get(ess_name, "Unknown")
+            rarity = rarity_map.get(ess_name, "Unknown")
             if rarity not in rarity_usage:
                 rarity_usage[rarity] = {"used": 0, "total_uses": 0}
             rarity_usage[rarity]["used"] += 1
@@ -264,13 +257,40 @@ class BuildAnalyzer:
                 (name, count) for name, count in sorted_usage
                 if count <= 2
             ],
-            "most_common_pairs": [
-                {"pair": list(pair), "count": count}
-                for pair, count in sorted_pairs[:10]
-            ],
             "usage_by_rarity": rarity_usage,
         }
 
+    def essence_meta_report_pairs(self, limit: int = 10) -> List[Dict]:
+        """Most commonly co-occurring essence pairs (emergent synergies)."""
+        cooccurrence: Dict[Tuple[str, str], int] = {}
+
+        for builds in self.loader.builds.values():
+            for build in builds:
+                build_essences = set()
+                for m in build.get("memories", []):
+                    build_essences.update(m.get("essences", []))
+
+                # Track which essences appear together
+                sorted_ess = sorted(build_essences)
+                for i, e1 in enumerate(sorted_ess):
+                    for e2 in sorted_ess[i + 1:]:
+                        pair = (e1, e2)
+                        cooccurrence[pair] = cooccurrence.get(pair, 0) + 1
+
+        sorted_pairs = sorted(cooccurrence.items(), key=lambda x: x[1], reverse=True)
+        rarity_map = self.loader.essence_rarity_map
+        return [
+            {
+                "pair": list(pair),
+                "count": count,
+                "display": "  +  ".join(
+                    f"[{rarity_map.get(name, 'Unknown')[0]}] {name}"
+                    for name in pair
+                ),
+            }
+            for pair, count in sorted_pairs[:limit]
+        ]
+
     def build_scorecard(self, character: str, build_name: str) -> Optional[Dict]:
         """
         Generate a comprehensive scorecard for a specific build.
@@ -6,11 +6,38 @@ Used by view_builds.py, build_comparator.py, and synergy_analyzer.py.
 """
 
 import json
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any
 
 from analysis.paths import get_base_dir, get_custom_builds_dir
 
+# orjson parses and encodes noticeably faster when installed; its
+# JSONDecodeError subclasses json's, so error handling below covers both
+try:
+    import orjson
+except ImportError:
+    orjson = None
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write *data* as 2-space-indented UTF-8 JSON via a temp file and
+    rename, so a crash mid-write never leaves a truncated file."""
+    tmp_path = path.with_suffix(".tmp")
+    if orjson is not None:
+        # Same layout as the stdlib branch: 2-space indent, raw UTF-8
+        tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        # dumps + one write: json.dump calls f.write once per token
+        tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False),
+                            encoding="utf-8")
+    tmp_path.replace(path)
+
+
+# Rarity tiers reported by count_rarity, in display order
+_RARITY_TIERS = ("Legendary", "Epic", "Rare", "Common", "Unique")
+
 
 class DataLoadError(Exception):
     """Raised when game data files cannot be loaded."""
@@ -40,19 +67,26 @@ class DataLoader:
         self._astrology_tree: Optional[Dict] = None
         self._constellation_powers: Optional[Any] = None
 
+        # Bundled + custom merges (reset whenever custom builds change)
+        self._all_builds: Optional[Dict[str, List[Dict]]] = None
+        self._all_character_names: Optional[List[str]] = None
+
         # Lookup tables (built on first access)
         self._essence_by_name: Optional[Dict[str, Dict]] = None
         self._essence_rarity_map: Optional[Dict[str, str]] = None
+        self._essence_types_map: Optional[Dict[str, FrozenSet[str]]] = None
+        self._essences_by_synergy_type: Optional[Dict[str, List[Dict]]] = None
         self._memory_by_name: Optional[Dict[str, Dict]] = None
         self._character_by_name: Optional[Dict[str, Dict]] = None
+        self._essence_usage_counts: Optional[Counter] = None
+        self._memory_usage_counts: Optional[Counter] = None
 
     def _load_json(self, path: Path) -> Any:
         """Load a JSON file with proper error handling."""
         if not path.exists():
             raise DataLoadError(f"File not found: {path}")
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _json_loads(path.read_bytes())
         except json.JSONDecodeError as e:
             raise DataLoadError(f"Invalid JSON in {path}: {e}")
         except IOError as e:
@@ -100,19 +134,23 @@ class DataLoader:
 
     @property
     def all_builds(self) -> Dict[str, List[Dict]]:
-        """Merged view: bundled builds + custom builds."""
-        merged = {}
-        for char, builds in self.builds.items():
-            merged[char] = list(builds)
-        for char, builds in self.custom_builds.items():
-            merged.setdefault(char, []).extend(builds)
-        return merged
+        """Merged view: bundled builds + custom builds (shared; do not mutate)."""
+        if self._all_builds is None:
+            merged = {}
+            for char, builds in self.builds.items():
+                merged[char] = list(builds)
+            for char, builds in self.custom_builds.items():
+                merged.setdefault(char, []).extend(builds)
+            self._all_builds = merged
+        return self._all_builds
 
     @property
     def all_character_names(self) -> List[str]:
         """Character names from both bundled and custom builds."""
-        names = set(self.builds.keys()) | set(self.custom_builds.keys())
-        return sorted(names)
+        if self._all_character_names is None:
+            names = set(self.builds.keys()) | set(self.custom_builds.keys())
+            self._all_character_names = sorted(names)
+        return self._all_character_names
 
     def is_custom_build(self, character: str, build_name: str) -> bool:
         """Check if a build is user-created (lives in custom_builds/)."""
@@ -146,6 +184,8 @@ class DataLoader:
         replaced = False
         for i, b in enumerate(builds_list):
             if b.get("name") == build["name"]:
+                if b == build:
+                    return file_path  # Identical save: nothing to write
                 builds_list[i] = build
                 replaced = True
                 break
@@ -153,12 +193,10 @@ class DataLoader:
             builds_list.append(build)
 
         data["builds"] = builds_list
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(file_path, data)
 
         # Invalidate custom cache so next access reloads
-        self._custom_builds = None
+        self._invalidate_custom_builds()
         return file_path
 
     def delete_custom_build(self, character: str, build_name: str) -> bool:
@@ -181,12 +219,17 @@ class DataLoader:
             return False
 
         data["builds"] = builds_list
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(file_path, data)
 
-        self._custom_builds = None
+        self._invalidate_custom_builds()
         return True
 
+    def _invalidate_custom_builds(self):
+        """Drop custom builds and every merge derived from them."""
+        self._custom_builds = None
+        self._all_builds = None
+        self._all_character_names = None
+
     @property
     def essences(self) -> List[Dict]:
         """All essence definitions."""
@@ -244,6 +287,26 @@ class DataLoader:
             self._essence_rarity_map = {e["name"]: e["rarity"] for e in self.essences}
         return self._essence_rarity_map
 
+    @property
+    def essence_types_map(self) -> Dict[str, FrozenSet[str]]:
+        """Essence name -> frozenset of synergy types."""
+        if self._essence_types_map is None:
+            self._essence_types_map = {
+                e["name"]: frozenset(e.get("synergy_types", [])) for e in self.essences
+            }
+        return self._essence_types_map
+
+    @property
+    def essences_by_synergy_type(self) -> Dict[str, List[Dict]]:
+        """Synergy type -> essences having that type, in catalog order."""
+        if self._essences_by_synergy_type is None:
+            index: Dict[str, List[Dict]] = {}
+            for e in self.essences:
+                for t in e.get("synergy_types", []):
+                    index.setdefault(t, []).append(e)
+            self._essences_by_synergy_type = index
+        return self._essences_by_synergy_type
+
     @property
     def memory_by_name(self) -> Dict[str, Dict]:
         """Memory lookup by name."""
@@ -258,6 +321,31 @@ class DataLoader:
             self._character_by_name = {c["name"]: c for c in self.characters}
         return self._character_by_name
 
+    @property
+    def essence_usage_counts(self) -> Counter:
+        """Essence name -> number of memory slots using it across bundled builds."""
+        if self._essence_usage_counts is None:
+            self._essence_usage_counts = Counter(
+                e
+                for builds in self.builds.values()
+                for build in builds
+                for m in build.get("memories", [])
+                for e in m.get("essences", [])
+            )
+        return self._essence_usage_counts
+
+    @property
+    def memory_usage_counts(self) -> Counter:
+        """Memory name -> number of times it appears across bundled builds."""
+        if self._memory_usage_counts is None:
+            self._memory_usage_counts = Counter(
+                m.get("name", "")
+                for builds in self.builds.values()
+                for build in builds
+                for m in build.get("memories", [])
+            )
+        return self._memory_usage_counts
+
     @property
     def character_names(self) -> List[str]:
         """List of all character names from build files."""
@@ -289,17 +377,16 @@ class DataLoader:
 
     def count_rarity(self, build: Dict) -> Dict[str, int]:
         """Count essences by rarity tier in a build."""
-        counts = {"Legendary": 0, "Epic": 0, "Rare": 0, "Common": 0, "Unique": 0}
-        for essence_name in self.get_all_essences_in_build(build):
-            rarity = self.essence_rarity_map.get(essence_name, "Unknown")
-            if rarity in counts:
-                counts[rarity] += 1
-        return counts
+        rarity_map = self.essence_rarity_map
+        tally = Counter(rarity_map.get(name, "Unknown")
+                        for name in self.get_all_essences_in_build(build))
+        # Fixed tiers in a fixed order; unknown rarities are not reported
+        return {rarity: tally[rarity] for rarity in _RARITY_TIERS}
 
     def invalidate_cache(self):
         """Clear all caches. Useful if data files have changed."""
         self._builds = None
-        self._custom_builds = None
+        self._invalidate_custom_builds()
         self._essences = None
         self._memories = None
         self._characters = None
@@ -307,8 +394,12 @@ class DataLoader:
         self._constellation_powers = None
         self._essence_by_name = None
         self._essence_rarity_map = None
+        self._essence_types_map = None
+        self._essences_by_synergy_type = None
         self._memory_by_name = None
         self._character_by_name = None
+        self._essence_usage_counts = None
+        self._memory_usage_counts = None
 
 
 # Module-level singleton for convenience
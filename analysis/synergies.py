@@ -5,6 +5,7 @@ Single source of truth for all synergy pairs, categories, and scoring.
 Used by both build_comparator.py and synergy_analyzer.py.
 """
 
+from functools import lru_cache
 from typing import Dict, FrozenSet, List, Set, Tuple
 
 
@@ -190,10 +191,26 @@ SOLO_ESSENCE_SCORES: Dict[str, int] = {
     "Perfection": 12,           # +7 AD/AP, +35 HP, +10% AS, +6% Crit, +10 Haste - universal stat stick
 }
 
-# Pre-computed frozenset lookup for O(1) pair checking
-_SYNERGY_FROZENSET_MAP: Dict[FrozenSet[str], Dict] = {
-    frozenset(pair): info for pair, info in ESSENCE_SYNERGIES.items()
-}
+def _validate_synergy_tables() -> None:
+    """Fail fast on malformed synergy entries (checked once, at import)."""
+    for pair, info in ESSENCE_SYNERGIES.items():
+        score = info.get("score")
+        if not isinstance(score, int) or score <= 0:
+            raise ValueError(f"Synergy {pair} needs a positive int score, got {score!r}")
+        description = info.get("description")
+        if not isinstance(description, str) or not description:
+            raise ValueError(f"Synergy {pair} needs a non-empty description")
+
+
+if __debug__:
+    _validate_synergy_tables()
+
+# Pair lookups keyed by both orderings, so a lookup is one tuple probe
+_PAIR_INFO: Dict[Tuple[str, str], Dict] = {}
+_PAIR_SCORE: Dict[Tuple[str, str], int] = {}
+for (a, b), info in ESSENCE_SYNERGIES.items():
+    _PAIR_INFO[(a, b)] = _PAIR_INFO[(b, a)] = info
+    _PAIR_SCORE[(a, b)] = _PAIR_SCORE[(b, a)] = info["score"]
 
 # Pre-computed frozenset scores (compatible with old BuildComparator format)
 _SYNERGY_PAIR_SCORES: Dict[FrozenSet[str], int] = {
@@ -203,17 +220,62 @@ _SYNERGY_PAIR_SCORES: Dict[FrozenSet[str], int] = {
 for name, score in SOLO_ESSENCE_SCORES.items():
     _SYNERGY_PAIR_SCORES[frozenset([name])] = score
 
+# Essence -> (partner, score) for every pair it is in, so scoring only
+# visits pairs that touch the set instead of every known pair
+_PARTNERS: Dict[str, List[Tuple[str, int]]] = {}
+for (a, b), info in ESSENCE_SYNERGIES.items():
+    _PARTNERS.setdefault(a, []).append((b, info["score"]))
+    _PARTNERS.setdefault(b, []).append((a, info["score"]))
+
+# synergy_type -> categories that include it (inverse of SYNERGY_CATEGORIES)
+_TYPE_TO_CATEGORIES: Dict[str, List[str]] = {}
+for category, types in SYNERGY_CATEGORIES.items():
+    for synergy_type in types:
+        _TYPE_TO_CATEGORIES.setdefault(synergy_type, []).append(category)
+_CATEGORY_POSITION: Dict[str, int] = {c: i for i, c in enumerate(SYNERGY_CATEGORIES)}
+
+# Summary stats over the pair table (pairs only; solo scores count toward the total)
+ESSENCE_SYNERGY_MAX: int = max(i["score"] for i in ESSENCE_SYNERGIES.values())
+ESSENCE_SYNERGY_AVG: int = sum(i["score"] for i in ESSENCE_SYNERGIES.values()) // len(ESSENCE_SYNERGIES)
+ESSENCE_SYNERGY_TOTAL: int = len(ESSENCE_SYNERGIES) + len(SOLO_ESSENCE_SCORES)
+
 
 def get_synergy_for_pair(essence_a: str, essence_b: str) -> Dict:
     """Look up synergy info for a pair of essences (order-independent)."""
-    key = frozenset([essence_a, essence_b])
-    return _SYNERGY_FROZENSET_MAP.get(key, {})
+    return _PAIR_INFO.get((essence_a, essence_b), {})
 
 
 def get_pair_score(essence_a: str, essence_b: str) -> int:
     """Get the synergy score for a pair of essences."""
-    info = get_synergy_for_pair(essence_a, essence_b)
-    return info.get("score", 0)
+    return _PAIR_SCORE.get((essence_a, essence_b), 0)
+
+
+# The synergy tables are module constants, so results depend only on the
+# essence set; callers re-score the same sets often (GUI toggles, CLI loops).
+# Sized to hold every bundled build's full and per-memory sets at once.
+@lru_cache(maxsize=2048)
+def _score_frozenset(essences: FrozenSet[str]) -> int:
+    total = 0
+    for name in essences:
+        total += SOLO_ESSENCE_SCORES.get(name, 0)
+        for partner, score in _PARTNERS.get(name, ()):
+            # Each pair is seen from both ends; count it from the smaller
+            if partner > name and partner in essences:
+                total += score
+    return total
+
+
+@lru_cache(maxsize=2048)
+def _synergies_in_frozenset(essences: FrozenSet[str]) -> Tuple[Tuple[Tuple[str, ...], int, str], ...]:
+    found = []
+    for (e1, e2), info in ESSENCE_SYNERGIES.items():
+        if e1 in essences and e2 in essences:
+            found.append(((e1, e2), info["score"], info["description"]))
+    # Solo synergies
+    for name, score in SOLO_ESSENCE_SCORES.items():
+        if name in essences:
+            found.append(((name,), score, f"{name} provides standalone value"))
+    return tuple(found)
 
 
 def score_essence_set(essences: Set[str]) -> int:
@@ -221,11 +283,7 @@ def score_essence_set(essences: Set[str]) -> int:
     Calculate total synergy score for a set of essences.
     Checks all known synergy pairs (including solo essences).
     """
-    total = 0
-    for synergy_set, score in _SYNERGY_PAIR_SCORES.items():
-        if synergy_set.issubset(essences):
-            total += score
-    return total
+    return _score_frozenset(frozenset(essences))
 
 
 def find_all_synergies_in_set(essences: Set[str]) -> List[Dict]:
@@ -233,29 +291,31 @@ def find_all_synergies_in_set(essences: Set[str]) -> List[Dict]:
     Find all synergy pairs present in a set of essences.
     Returns list of {pair, score, description} dicts.
     """
-    found = []
-    for (e1, e2), info in ESSENCE_SYNERGIES.items():
-        if e1 in essences and e2 in essences:
-            found.append({
-                "pair": [e1, e2],
-                "score": info["score"],
-                "description": info["description"],
-            })
-    # Solo synergies
-    for name, score in SOLO_ESSENCE_SCORES.items():
-        if name in essences:
-            found.append({
-                "pair": [name],
-                "score": score,
-                "description": f"{name} provides standalone value",
-            })
-    return found
+    # Fresh dicts each call so callers may mutate the result
+    return [
+        {"pair": list(pair), "score": score, "description": description}
+        for pair, score, description in _synergies_in_frozenset(frozenset(essences))
+    ]
+
+
+@lru_cache(maxsize=1)
+def sorted_pairs_rows() -> Tuple[Tuple[str, str, int, str], ...]:
+    """
+    All known synergies as (essence_a, essence_b, score, description) rows,
+    highest score first. Solo essences use "(standalone)" as essence_b.
+    """
+    rows = [(e1, e2, info["score"], info["description"])
+            for (e1, e2), info in ESSENCE_SYNERGIES.items()]
+    rows.extend((name, "(standalone)", score, f"{name} provides standalone value")
+                for name, score in SOLO_ESSENCE_SCORES.items())
+    rows.sort(key=lambda r: r[2], reverse=True)
+    return tuple(rows)
 
 
 def get_category_for_types(synergy_types: Set[str]) -> List[str]:
     """Given a set of synergy_types from an essence, return matching categories."""
-    matched = []
-    for category, types in SYNERGY_CATEGORIES.items():
-        if synergy_types.intersection(types):
-            matched.append(category)
-    return matched
+    matched = set()
+    for synergy_type in synergy_types:
+        matched.update(_TYPE_TO_CATEGORIES.get(synergy_type, ()))
+    # Same order as SYNERGY_CATEGORIES
+    return sorted(matched, key=_CATEGORY_POSITION.__getitem__)
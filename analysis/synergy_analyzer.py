@@ -5,7 +5,7 @@ Analyzes synergies between Memories, Essences, and Character abilities
 to identify optimal build combinations. Uses shared modules.
 """
 
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, FrozenSet, Set, Optional
 
 try:
     from analysis.data_loader import DataLoader, get_loader
@@ -27,6 +27,10 @@ except ImportError:
     )
 
 
+# Category type lists as sets, for the overlap bonus in find_synergies
+_CATEGORY_TYPE_SETS = tuple(frozenset(types) for types in SYNERGY_CATEGORIES.values())
+
+
 class SynergyAnalyzer:
     def __init__(self, loader: Optional[DataLoader] = None):
         self.loader = loader or get_loader()
@@ -34,9 +38,8 @@ class SynergyAnalyzer:
 
     def _build_lookup_tables(self):
         """Build lookup tables for synergy type matching."""
-        self.essence_synergy_types: Dict[str, Set[str]] = {
-            e["name"]: set(e.get("synergy_types", [])) for e in self.loader.essences
-        }
+        # Shared with the loader (frozensets, built once per data load)
+        self.essence_synergy_types: Dict[str, FrozenSet[str]] = self.loader.essence_types_map
         self.memory_keywords: Dict[str, Set[str]] = {
             m["name"]: set(m.get("synergy_keywords", [])) for m in self.loader.memories
         }
@@ -61,7 +64,7 @@ class SynergyAnalyzer:
 
         # Memory-Essence synergies
         for essence in essences:
-            essence_types = self.essence_synergy_types.get(essence["name"], set())
+            essence_types = self.essence_synergy_types.get(essence["name"], frozenset())
             matches = memory_kw.intersection(essence_types)
             if matches:
                 synergy_score += len(matches) * 10
@@ -91,10 +94,9 @@ class SynergyAnalyzer:
 
         # Category overlap bonus
         essence_type_sets = [
-            self.essence_synergy_types.get(name, set()) for name in essence_names
+            self.essence_synergy_types.get(name, frozenset()) for name in essence_names
         ]
-        for category, types in SYNERGY_CATEGORIES.items():
-            types_set = set(types)
+        for types_set in _CATEGORY_TYPE_SETS:
             count = sum(1 for ets in essence_type_sets if ets.intersection(types_set))
             if count >= 2:
                 synergy_score += 5 * (count - 1)
@@ -218,7 +220,7 @@ class SynergyAnalyzer:
             if essence["name"] in current_essences:
                 continue
 
-            essence_types = self.essence_synergy_types.get(essence["name"], set())
+            essence_types = self.essence_synergy_types.get(essence["name"], frozenset())
             matches = memory_kw.intersection(essence_types)
 
             if matches:
@@ -248,7 +250,8 @@ class SynergyAnalyzer:
         if not original:
             return []
 
-        original_types = set(original.get("synergy_types", []))
+        types_map = self.loader.essence_types_map
+        original_types = types_map[essence_name]
         original_rarity = original.get("rarity", "Common")
         if not original_types:
             return []
@@ -257,8 +260,7 @@ class SynergyAnalyzer:
         for essence in self.loader.essences:
             if essence["name"] == essence_name:
                 continue
-            ess_types = set(essence.get("synergy_types", []))
-            overlap = original_types.intersection(ess_types)
+            overlap = original_types.intersection(types_map[essence["name"]])
             if overlap:
                 # Prefer same or adjacent rarity
                 rarity_match = 1 if essence["rarity"] == original_rarity else 0
@@ -4,6 +4,7 @@ Shared Build Validators for Shape of Dreams ARPG Builds
 Centralized validation logic used across all modules.
 """
 
+from itertools import chain
 from typing import Dict, List, Set, Optional
 
 # Try to import DataLoader for cross-reference validation
@@ -12,6 +13,9 @@ try:
 except ImportError:
     from data_loader import DataLoader
 
+# Fields every build must define, checked in this order
+_REQUIRED_FIELDS = ("name", "concept", "playstyle", "memories")
+
 
 class ValidationResult:
     """Structured validation result."""
@@ -43,27 +47,27 @@ def validate_no_duplicate_essences(build: Dict) -> Dict:
 
     Returns dict with 'valid', 'duplicates', 'total_essences', 'unique_essences'.
     """
-    all_essences: List[str] = []
-    for memory in build.get("memories", []):
-        all_essences.extend(memory.get("essences", []))
-
+    memory_essences = (essence for memory in build.get("memories", [])
+                       for essence in memory.get("essences", []))
     # Also check passive essences
-    for passive in build.get("passive_essences", []):
-        name = passive.get("name", "") if isinstance(passive, dict) else passive
-        if name:
-            all_essences.append(name)
+    passive_essences = (
+        passive.get("name", "") if isinstance(passive, dict) else passive
+        for passive in build.get("passive_essences", [])
+    )
 
+    # One pass: the first sighting goes into seen, repeats into duplicates
     seen: Set[str] = set()
     duplicates: List[str] = []
-    for essence in all_essences:
+    for essence in chain(memory_essences, filter(None, passive_essences)):
         if essence in seen:
             duplicates.append(essence)
-        seen.add(essence)
+        else:
+            seen.add(essence)
 
     return {
         "valid": len(duplicates) == 0,
         "duplicates": duplicates,
-        "total_essences": len(all_essences),
+        "total_essences": len(seen) + len(duplicates),
         "unique_essences": len(seen),
     }
 
@@ -100,9 +104,8 @@ def validate_build_schema(build: Dict) -> ValidationResult:
     Validate that a build has all required fields and proper structure.
     """
     result = ValidationResult()
-    required_fields = ["name", "concept", "playstyle", "memories"]
 
-    for field in required_fields:
+    for field in _REQUIRED_FIELDS:
         if field not in build:
             result.add_error(f"Missing required field: '{field}'")
 
@@ -183,6 +183,7 @@ class BuildAnalyzerApp(ttk.Window):
         self.loader.invalidate_cache()
         self._builds_tab._load_data()
         self._compare_tab._populate_dropdowns()
+        self._create_tab.invalidate_load_dropdown()
         self._create_tab._refresh_load_dropdown()
         self._refresh_sidebar()
         self._refresh_statusbar()
@@ -1,5 +1,6 @@
 """Build Creator tab - create, edit, and save custom builds."""
 
+import itertools
 import tkinter as tk
 from tkinter import messagebox
 import ttkbootstrap as ttk
@@ -20,6 +21,19 @@ class CreateTab(ttk.Frame):
 
     MAX_MEMORIES = 4
 
+    # Shared font tuples (one allocation instead of one per widget)
+    FONT_9 = ("Segoe UI", 9)
+    FONT_9_BOLD = ("Segoe UI", 9, "bold")
+    FONT_10 = ("Segoe UI", 10)
+    FONT_10_BOLD = ("Segoe UI", 10, "bold")
+    FONT_11_BOLD = ("Segoe UI", 11, "bold")
+    FONT_16_BOLD = ("Segoe UI", 16, "bold")
+
+    # Validation label styles (configured once in _configure_styles)
+    STYLE_ERROR = "Error.TLabel"
+    STYLE_WARNING = "Warning.TLabel"
+    STYLE_OK = "OK.TLabel"
+
     def __init__(self, parent, loader, analyzer,
                  on_build_saved=None, **kwargs):
         super().__init__(parent, **kwargs)
@@ -28,19 +42,31 @@ class CreateTab(ttk.Frame):
         self._on_build_saved = on_build_saved
         self._memory_slots = []
         self._debounce_id = None
+        self._pending_when_visible = False  # Preview skipped while hidden
         self._editing_custom = False  # True when editing existing custom build
+        self._text_cache = {}  # id(Text widget) -> stripped contents
+        self._load_names_cache = None  # Load Existing values; None = stale
 
-        # Precompute dropdown values
-        self._memory_names = sorted(m["name"] for m in self.loader.memories)
-        self._essence_names = sorted(e["name"] for e in self.loader.essences)
+        # Precompute dropdown values; every memory slot shares these tuples
+        self._memory_names = tuple(sorted(m["name"] for m in self.loader.memories))
+        self._essence_names = tuple(sorted(e["name"] for e in self.loader.essences))
         self._char_names = sorted(
             set(c["name"] for c in self.loader.characters) | {"General"}
         )
 
+        self._configure_styles()
         self._setup_ui()
+        self.bind("<Map>", self._on_map)
 
     # ── UI Setup ─────────────────────────────────────────────────────
 
+    def _configure_styles(self):
+        style = ttk.Style()
+        for name, color in [(self.STYLE_ERROR, ERROR),
+                            (self.STYLE_WARNING, WARNING),
+                            (self.STYLE_OK, SUCCESS)]:
+            style.configure(name, foreground=color, font=self.FONT_9)
+
     def _setup_ui(self):
         # Scrollable canvas
         self._canvas = tk.Canvas(self, highlightthickness=0)
@@ -81,10 +107,10 @@ class CreateTab(ttk.Frame):
 
         # ── Title ────────────────────────────────────────────────────
         ttk.Label(f, text="Build Creator",
-                  font=("Segoe UI", 16, "bold"),
+                  font=self.FONT_16_BOLD,
                   bootstyle="light").pack(anchor="w", padx=PAD, pady=(PAD, 0))
         ttk.Label(f, text="Create and save your own custom builds",
-                  font=("Segoe UI", 10),
+                  font=self.FONT_10,
                   bootstyle="secondary").pack(anchor="w", padx=PAD)
 
         ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD)
@@ -94,7 +120,7 @@ class CreateTab(ttk.Frame):
         top_row.pack(fill="x", padx=PAD, pady=PAD_SM)
 
         ttk.Label(top_row, text="Character:",
-                  font=("Segoe UI", 10, "bold")).pack(side="left")
+                  font=self.FONT_10_BOLD).pack(side="left")
         self._char_var = ttk.StringVar()
         self._char_combo = ttk.Combobox(
             top_row, textvariable=self._char_var,
@@ -104,7 +130,7 @@ class CreateTab(ttk.Frame):
                               lambda e: self._schedule_update())
 
         ttk.Label(top_row, text="Build Name:",
-                  font=("Segoe UI", 10, "bold")).pack(side="left")
+                  font=self.FONT_10_BOLD).pack(side="left")
         self._name_var = ttk.StringVar()
         self._name_entry = ttk.Entry(top_row, textvariable=self._name_var,
                                      width=35)
@@ -115,11 +141,11 @@ class CreateTab(ttk.Frame):
         for label_text, attr_name in [("Concept", "_concept_text"),
                                       ("Playstyle", "_playstyle_text")]:
             ttk.Label(f, text=label_text,
-                      font=("Segoe UI", 10, "bold"),
+                      font=self.FONT_10_BOLD,
                       bootstyle="info").pack(anchor="w", padx=PAD,
                                               pady=(PAD_SM, 0))
             text = tk.Text(f, height=2, width=70, wrap="word",
-                           font=("Segoe UI", 9),
+                           font=self.FONT_9,
                            bg="#2b3035", fg="#e8e8e8",
                            insertbackground="#e8e8e8",
                            relief="flat", padx=6, pady=4)
@@ -131,7 +157,7 @@ class CreateTab(ttk.Frame):
         mem_header = ttk.Frame(f)
         mem_header.pack(fill="x", padx=PAD)
         ttk.Label(mem_header, text="Memories (4 slots, 3 essences each)",
-                  font=("Segoe UI", 11, "bold"),
+                  font=self.FONT_11_BOLD,
                   bootstyle="info").pack(side="left")
 
         self._slots_container = ttk.Frame(f)
@@ -155,11 +181,11 @@ class CreateTab(ttk.Frame):
         syn_frame = ttk.Frame(preview_row)
         syn_frame.pack(side="left", fill="both", expand=True, padx=(0, PAD))
         ttk.Label(syn_frame, text="Synergy Preview",
-                  font=("Segoe UI", 11, "bold"),
+                  font=self.FONT_11_BOLD,
                   bootstyle="success").pack(anchor="w")
         self._syn_score_label = ttk.Label(
             syn_frame, text="Score: --",
-            font=("Segoe UI", 10))
+            font=self.FONT_10)
         self._syn_score_label.pack(anchor="w", padx=PAD_SM)
         self._syn_bar = ScoreBar(syn_frame, score=0, width=200, height=16)
         self._syn_bar.pack(anchor="w", padx=PAD_SM, pady=PAD_SM)
@@ -170,7 +196,7 @@ class CreateTab(ttk.Frame):
         val_frame = ttk.Frame(preview_row)
         val_frame.pack(side="right", fill="both", expand=True, padx=(PAD, 0))
         ttk.Label(val_frame, text="Validation",
-                  font=("Segoe UI", 11, "bold"),
+                  font=self.FONT_11_BOLD,
                   bootstyle="warning").pack(anchor="w")
         self._val_frame = ttk.Frame(val_frame)
         self._val_frame.pack(anchor="w", fill="x")
@@ -179,11 +205,11 @@ class CreateTab(ttk.Frame):
         ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD)
 
         ttk.Label(f, text="Strategy",
-                  font=("Segoe UI", 10, "bold"),
+                  font=self.FONT_10_BOLD,
                   bootstyle="info").pack(anchor="w", padx=PAD)
         self._strategy_text = tk.Text(
             f, height=2, width=70, wrap="word",
-            font=("Segoe UI", 9),
+            font=self.FONT_9,
             bg="#2b3035", fg="#e8e8e8",
             insertbackground="#e8e8e8",
             relief="flat", padx=6, pady=4)
@@ -196,11 +222,11 @@ class CreateTab(ttk.Frame):
         left = ttk.Frame(str_weak_row)
         left.pack(side="left", fill="both", expand=True, padx=(0, PAD))
         ttk.Label(left, text="Strengths (one per line)",
-                  font=("Segoe UI", 10, "bold"),
+                  font=self.FONT_10_BOLD,
                   foreground=SUCCESS).pack(anchor="w")
         self._strengths_text = tk.Text(
             left, height=4, width=35, wrap="word",
-            font=("Segoe UI", 9),
+            font=self.FONT_9,
             bg="#2b3035", fg="#e8e8e8",
             insertbackground="#e8e8e8",
             relief="flat", padx=6, pady=4)
@@ -210,11 +236,11 @@ class CreateTab(ttk.Frame):
         right = ttk.Frame(str_weak_row)
         right.pack(side="right", fill="both", expand=True, padx=(PAD, 0))
         ttk.Label(right, text="Weaknesses (one per line)",
-                  font=("Segoe UI", 10, "bold"),
+                  font=self.FONT_10_BOLD,
                   foreground=ERROR).pack(anchor="w")
         self._weaknesses_text = tk.Text(
             right, height=4, width=35, wrap="word",
-            font=("Segoe UI", 9),
+            font=self.FONT_9,
             bg="#2b3035", fg="#e8e8e8",
             insertbackground="#e8e8e8",
             relief="flat", padx=6, pady=4)
@@ -235,7 +261,7 @@ class CreateTab(ttk.Frame):
                    command=self._clear_form).pack(side="left", padx=(0, PAD))
 
         ttk.Label(btn_row, text="Load existing:",
-                  font=("Segoe UI", 9)).pack(side="left", padx=(PAD_LG, PAD_SM))
+                  font=self.FONT_9).pack(side="left", padx=(PAD_LG, PAD_SM))
         self._load_var = ttk.StringVar()
         self._load_combo = ttk.Combobox(
             btn_row, textvariable=self._load_var,
@@ -252,6 +278,26 @@ class CreateTab(ttk.Frame):
         # Bottom padding
         ttk.Label(f, text="").pack(pady=PAD)
 
+        # Invalidate cached text only when a Text widget is edited
+        for text_widget in self._text_widgets():
+            text_widget.bind(
+                "<<Modified>>",
+                lambda e, w=text_widget: (self._text_cache.pop(id(w), None),
+                                          w.edit_modified(False)))
+
+    def _text_widgets(self):
+        return (self._concept_text, self._playstyle_text,
+                self._strategy_text, self._strengths_text,
+                self._weaknesses_text)
+
+    def _text_value(self, widget) -> str:
+        """Stripped contents of a Text widget, cached until it is modified."""
+        text = self._text_cache.get(id(widget))
+        if text is None:
+            text = widget.get("1.0", "end-1c").strip()
+            self._text_cache[id(widget)] = text
+        return text
+
     # ── Memory Slot Management ───────────────────────────────────────
 
     def _add_memory_slot(self):
@@ -265,26 +311,22 @@ class CreateTab(ttk.Frame):
             essence_names=self._essence_names,
             rarity_map=self.loader.essence_rarity_map,
             on_change=self._schedule_update,
-            on_remove=lambda s=slot_num: self._remove_memory_slot(s),
+            on_remove=self._remove_memory_slot,
+            slot_list=self._memory_slots,
         )
         slot.pack(fill="x", pady=PAD_SM)
         self._memory_slots.append(slot)
         self._update_add_btn()
         self._schedule_update()
 
-    def _remove_memory_slot(self, slot_num):
-        if len(self._memory_slots) <= 1:
+    def _remove_memory_slot(self, slot):
+        if len(self._memory_slots) <= 1 or slot not in self._memory_slots:
             return
-        # Remove the slot widget
-        idx = slot_num - 1
-        if idx < len(self._memory_slots):
-            self._memory_slots[idx].destroy()
-            self._memory_slots.pop(idx)
-            # Renumber remaining slots
-            for i, slot in enumerate(self._memory_slots):
-                slot.slot_number = i + 1
-            self._update_add_btn()
-            self._schedule_update()
+        # Slot numbers derive from list position, so no renumbering needed
+        self._memory_slots.remove(slot)
+        slot.destroy()
+        self._update_add_btn()
+        self._schedule_update()
 
     def _update_add_btn(self):
         if not hasattr(self, "_add_mem_btn"):
@@ -305,15 +347,23 @@ class CreateTab(ttk.Frame):
     def _update_preview(self):
         """Recalculate synergy score and validation."""
         self._debounce_id = None
+        if not self.winfo_ismapped():
+            # Nobody can see the result; recompute once the tab is shown
+            self._pending_when_visible = True
+            return
+        self._pending_when_visible = False
         self._update_synergy_preview()
         self._update_validation()
 
+    def _on_map(self, _event=None):
+        if self._pending_when_visible:
+            self._update_preview()
+
     # ── Synergy Preview ──────────────────────────────────────────────
 
     def _update_synergy_preview(self):
-        all_essences = set()
-        for slot in self._memory_slots:
-            all_essences.update(slot.essences)
+        all_essences = set().union(
+            *(slot.essences_frozenset for slot in self._memory_slots))
 
         # Clear old details
         for w in self._syn_details_frame.winfo_children():
@@ -338,7 +388,7 @@ class CreateTab(ttk.Frame):
             ttk.Label(
                 self._syn_details_frame,
                 text=f"  [{s['score']}pts] {pair_str}",
-                font=("Segoe UI", 9, "bold"),
+                font=self.FONT_9_BOLD,
                 foreground="#E3B341",
             ).pack(anchor="w")
 
@@ -386,36 +436,31 @@ class CreateTab(ttk.Frame):
             else:
                 ok_items.append("No duplicate essences")
 
-            # Check essence references
+            # Check essence references (set difference: empty in the
+            # common case, so no per-name Python loop)
             all_ess = set()
             for m in preview.get("memories", []):
                 all_ess.update(m.get("essences", []))
-            for ess_name in all_ess:
-                if ess_name not in self.loader.essence_by_name:
-                    warnings.append(f"Unknown essence: {ess_name}")
+            unknown_ess = all_ess.difference(self.loader.essence_by_name)
+            warnings.extend(f"Unknown essence: {n}" for n in unknown_ess)
 
             # Check memory references
-            for m in preview.get("memories", []):
-                mname = m.get("name", "")
-                if mname and mname not in self.loader.memory_by_name:
-                    warnings.append(f"Unknown memory: {mname}")
+            unknown_mems = {
+                m.get("name", "") for m in preview.get("memories", [])
+                if m.get("name")
+            }.difference(self.loader.memory_by_name)
+            warnings.extend(f"Unknown memory: {n}" for n in unknown_mems)
 
         # Render
         for e in errors:
-            ttk.Label(self._val_frame,
-                      text=f"  [X] {e}",
-                      font=("Segoe UI", 9),
-                      foreground=ERROR).pack(anchor="w")
+            ttk.Label(self._val_frame, text=f"  [X] {e}",
+                      style=self.STYLE_ERROR).pack(anchor="w")
         for w in warnings:
-            ttk.Label(self._val_frame,
-                      text=f"  [!] {w}",
-                      font=("Segoe UI", 9),
-                      foreground=WARNING).pack(anchor="w")
+            ttk.Label(self._val_frame, text=f"  [!] {w}",
+                      style=self.STYLE_WARNING).pack(anchor="w")
         for o in ok_items:
-            ttk.Label(self._val_frame,
-                      text=f"  [ok] {o}",
-                      font=("Segoe UI", 9),
-                      foreground=SUCCESS).pack(anchor="w")
+            ttk.Label(self._val_frame, text=f"  [ok] {o}",
+                      style=self.STYLE_OK).pack(anchor="w")
 
         # Enable/disable save button
         self._save_btn.configure(
@@ -432,19 +477,19 @@ class CreateTab(ttk.Frame):
 
         build = {
             "name": self._name_var.get().strip(),
-            "concept": self._concept_text.get("1.0", "end-1c").strip(),
-            "playstyle": self._playstyle_text.get("1.0", "end-1c").strip(),
+            "concept": self._text_value(self._concept_text),
+            "playstyle": self._text_value(self._playstyle_text),
             "_custom": True,
             "memories": memories,
         }
 
-        strategy = self._strategy_text.get("1.0", "end-1c").strip()
+        strategy = self._text_value(self._strategy_text)
         if strategy:
             build["strategy"] = strategy
 
         strengths = [
             s.strip() for s in
-            self._strengths_text.get("1.0", "end-1c").strip().split("\n")
+            self._text_value(self._strengths_text).split("\n")
             if s.strip()
         ]
         if strengths:
@@ -452,7 +497,7 @@ class CreateTab(ttk.Frame):
 
         weaknesses = [
             w.strip() for w in
-            self._weaknesses_text.get("1.0", "end-1c").strip().split("\n")
+            self._text_value(self._weaknesses_text).split("\n")
             if w.strip()
         ]
         if weaknesses:
@@ -500,6 +545,7 @@ class CreateTab(ttk.Frame):
 
             self._editing_custom = True
             self._delete_btn.configure(state="normal")
+            self.invalidate_load_dropdown()
             self._refresh_load_dropdown()
 
             if self._on_build_saved:
@@ -524,6 +570,7 @@ class CreateTab(ttk.Frame):
         if self.loader.delete_custom_build(character, name):
             messagebox.showinfo("Deleted", f"Build '{name}' deleted.")
             self._clear_form()
+            self.invalidate_load_dropdown()
             self._refresh_load_dropdown()
             if self._on_build_saved:
                 self._on_build_saved()
@@ -534,14 +581,24 @@ class CreateTab(ttk.Frame):
     # ── Load Existing ────────────────────────────────────────────────
 
     def _refresh_load_dropdown(self):
-        """Rebuild the Load Existing dropdown with all builds."""
-        names = []
-        for char, builds in sorted(self.loader.all_builds.items()):
-            for build in builds:
-                prefix = "[Custom] " if build.get("_custom") else ""
-                display = f"{prefix}{char.capitalize()} - {build['name']}"
-                names.append(display)
-        self._load_combo.configure(values=names)
+        """Rebuild the Load Existing dropdown with all builds.
+
+        The value list is cached and only reassembled after a save/delete.
+        """
+        if self._load_names_cache is not None:
+            return
+        char_builds = [(char.capitalize(), builds) for char, builds
+                       in sorted(self.loader.all_builds.items())]
+        self._load_names_cache = list(itertools.chain.from_iterable(
+            (f"{'[Custom] ' if build.get('_custom') else ''}"
+             f"{char_label} - {build['name']}" for build in builds)
+            for char_label, builds in char_builds
+        ))
+        self._load_combo.configure(values=self._load_names_cache)
+
+    def invalidate_load_dropdown(self):
+        """Mark the Load Existing values stale (builds were added/removed)."""
+        self._load_names_cache = None
 
     def _on_load_selected(self, _event=None):
         display = self._load_var.get()
@@ -589,6 +646,7 @@ class CreateTab(ttk.Frame):
         self._name_var.set(name)
 
         # Text fields
+        self._text_cache.clear()
         self._concept_text.delete("1.0", "end")
         self._concept_text.insert("1.0", build.get("concept", ""))
 
@@ -606,25 +664,26 @@ class CreateTab(ttk.Frame):
         self._weaknesses_text.insert(
             "1.0", "\n".join(build.get("weaknesses", [])))
 
-        # Memory slots - clear existing and recreate
-        for slot in self._memory_slots:
+        # Memory slots - reuse existing widgets, only destroy the surplus
+        # or create the shortfall (always keep at least 1 slot)
+        memories = build.get("memories", [])[:self.MAX_MEMORIES]
+        n_target = max(1, len(memories))
+        for slot in self._memory_slots[n_target:]:
             slot.destroy()
-        self._memory_slots.clear()
-
-        memories = build.get("memories", [])
-        for mem in memories[:self.MAX_MEMORIES]:
-            self._add_memory_slot()
-            slot = self._memory_slots[-1]
-            slot.set_values(
-                memory_name=mem.get("name", ""),
-                essences=mem.get("essences", []),
-                rationale=mem.get("rationale", ""),
-            )
-
-        # If no memories, ensure at least 1 slot
-        if not self._memory_slots:
+        del self._memory_slots[n_target:]
+        while len(self._memory_slots) < n_target:
             self._add_memory_slot()
 
+        for i, slot in enumerate(self._memory_slots):
+            slot.clear()
+            if i < len(memories):
+                mem = memories[i]
+                slot.set_values(
+                    memory_name=mem.get("name", ""),
+                    essences=mem.get("essences", []),
+                    rationale=mem.get("rationale", ""),
+                )
+
         self._editing_custom = is_custom
         self._delete_btn.configure(
             state="normal" if is_custom else "disabled")
@@ -639,9 +698,8 @@ class CreateTab(ttk.Frame):
         self._char_var.set("")
         self._name_var.set("")
 
-        for text_widget in [self._concept_text, self._playstyle_text,
-                            self._strategy_text, self._strengths_text,
-                            self._weaknesses_text]:
+        self._text_cache.clear()
+        for text_widget in self._text_widgets():
             text_widget.delete("1.0", "end")
 
         for slot in self._memory_slots:
@@ -3,15 +3,23 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.tableview import Tableview
 
+from analysis.build_comparator import BuildComparator
+from analysis.synergy_analyzer import SynergyAnalyzer
 from gui.theme import PAD, PAD_SM, RARITY_COLORS
+from gui.widgets.detail_list import DetailList
 from gui.widgets.search_bar import SearchBar
+from gui.widgets.table_filter import TableFilter
 
 
 class EssencesTab(ttk.Frame):
     def __init__(self, parent, loader, **kwargs):
         super().__init__(parent, **kwargs)
         self.loader = loader
+        self._comparator = BuildComparator(loader)
+        self._synergy_analyzer = SynergyAnalyzer(loader)
+        self._builds_with_essence = {}  # essence name -> find_builds_with_essence()
         self._all_rows = []
+        self._row_by_iid = {}
 
         self._setup_ui()
         self._load_data()
@@ -22,7 +30,7 @@ class EssencesTab(ttk.Frame):
         top.pack(fill="x", padx=PAD, pady=PAD)
 
         self._search = SearchBar(top, placeholder="Search essences...",
-                                 on_change=self._on_filter)
+                                 on_change=self._on_filter, delay=150)
         self._search.pack(side="left", fill="x", expand=True, padx=(0, PAD))
 
         ttk.Label(top, text="Rarity:").pack(side="left")
@@ -31,7 +39,7 @@ class EssencesTab(ttk.Frame):
                                     values=["All", "Legendary", "Unique", "Epic", "Rare", "Common"],
                                     width=12, state="readonly")
         rarity_menu.pack(side="left", padx=PAD_SM)
-        rarity_menu.bind("<<ComboboxSelected>>", lambda _: self._on_filter())
+        rarity_menu.bind("<<ComboboxSelected>>", self._on_filter)
 
         # Paned: table | detail
         pane = ttk.Panedwindow(self, orient="horizontal")
@@ -51,48 +59,101 @@ class EssencesTab(ttk.Frame):
                                  autofit=True, height=25)
         self._table.pack(fill="both", expand=True)
         self._table.view.bind("<<TreeviewSelect>>", self._on_select)
+        self._filter = TableFilter(self._table, on_resort=self._on_filter)
 
         # Right: detail
         self._detail = ttk.Frame(pane)
         pane.add(self._detail, weight=1)
+        self._setup_detail()
+
+    def _setup_detail(self):
+        """Create the detail widgets once; selections only reconfigure them."""
+        d = self._detail
+
+        self._header_frame = ttk.Frame(d)
+        self._name_lbl = ttk.Label(self._header_frame,
+                                   font=("Segoe UI", 14, "bold"))
+        self._name_lbl.pack(anchor="w", padx=PAD, pady=(PAD, 0))
+        self._rarity_lbl = ttk.Label(self._header_frame, font=("Segoe UI", 11))
+        self._rarity_lbl.pack(anchor="w", padx=PAD)
+        ttk.Separator(self._header_frame).pack(fill="x", padx=PAD, pady=PAD)
+        ttk.Label(self._header_frame, text="Effect",
+                  font=("Segoe UI", 11, "bold"), bootstyle="info").pack(
+            anchor="w", padx=PAD)
+        self._effect_lbl = ttk.Label(self._header_frame, wraplength=350,
+                                     font=("Segoe UI", 9))
+        self._effect_lbl.pack(anchor="w", padx=PAD * 2, pady=4)
+
+        self._types_frame = ttk.Frame(d)
+        ttk.Label(self._types_frame, text="Synergy Types",
+                  font=("Segoe UI", 11, "bold"), bootstyle="info").pack(
+            anchor="w", padx=PAD, pady=(PAD, 0))
+        self._types_lbl = ttk.Label(self._types_frame, font=("Segoe UI", 9))
+        self._types_lbl.pack(anchor="w", padx=PAD * 2)
+
+        self._builds_frame = ttk.Frame(d)
+        ttk.Separator(self._builds_frame).pack(fill="x", padx=PAD, pady=PAD)
+        self._builds_lbl = ttk.Label(self._builds_frame,
+                                     font=("Segoe UI", 11, "bold"),
+                                     bootstyle="success")
+        self._builds_lbl.pack(anchor="w", padx=PAD)
+        self._builds_list = DetailList(self._builds_frame)
+        self._builds_list.pack(anchor="w", fill="x", padx=PAD)
+
+        self._subs_frame = ttk.Frame(d)
+        ttk.Separator(self._subs_frame).pack(fill="x", padx=PAD, pady=PAD)
+        ttk.Label(self._subs_frame, text="Substitutes",
+                  font=("Segoe UI", 11, "bold"), bootstyle="warning").pack(
+            anchor="w", padx=PAD)
+        self._subs_list = DetailList(self._subs_frame)
+        self._subs_list.pack(anchor="w", fill="x", padx=PAD)
+
+        self._detail_sections = [self._header_frame, self._types_frame,
+                                 self._builds_frame, self._subs_frame]
 
     def _load_data(self):
-        # Count usage
-        usage = {}
-        for builds in self.loader.builds.values():
-            for build in builds:
-                for m in build.get("memories", []):
-                    for e in m.get("essences", []):
-                        usage[e] = usage.get(e, 0) + 1
+        usage = self.loader.essence_usage_counts
 
         self._all_rows = []
         self._essence_lookup = {}
+        self._builds_with_essence = {}
         for ess in self.loader.essences:
             name = ess["name"]
             rarity = ess.get("rarity", "Unknown")
             types = ", ".join(ess.get("synergy_types", []))
-            count = usage.get(name, 0)
-            self._all_rows.append((name, rarity, types, count))
+            count = usage[name]
+            # Display columns first, then lowercase search keys
+            self._all_rows.append(
+                (name, rarity, types, count, name.lower(), types.lower()))
             self._essence_lookup[name] = ess
 
+        # Insert every row once; filtering only detaches/reattaches items
+        self._table.delete_rows()
+        self._table.insert_rows("end", [row[:4] for row in self._all_rows])
+        self._table.load_table_data()
+        self._row_by_iid = {
+            table_row.iid: row
+            for table_row, row in zip(self._table.tablerows, self._all_rows)
+        }
+
+        self._filter.reset()
         self._on_filter()
 
-    def _on_filter(self, _query: str = ""):
+    def _on_filter(self, *_args):
         query = self._search.query.lower()
         rarity = self._rarity_var.get()
 
-        filtered = []
-        for row in self._all_rows:
-            name, r, types, count = row
+        if rarity == "All" and not query:
+            self._filter.set_filter((rarity, query))
+            return
+
+        def matches(iid):
+            _, r, _, _, name_lc, types_lc = self._row_by_iid[iid]
             if rarity != "All" and r != rarity:
-                continue
-            if query and query not in name.lower() and query not in types.lower():
-                continue
-            filtered.append(row)
+                return False
+            return not query or query in name_lc or query in types_lc
 
-        self._table.delete_rows()
-        self._table.insert_rows("end", filtered)
-        self._table.load_table_data()
+        self._filter.set_filter((rarity, query), matches)
 
     def _on_select(self, _event=None):
         selected = self._table.view.selection()
@@ -107,60 +168,44 @@ class EssencesTab(ttk.Frame):
         if not ess:
             return
 
-        # Clear and rebuild detail
-        for w in self._detail.winfo_children():
-            w.destroy()
-
         rarity = ess.get("rarity", "Unknown")
         color = RARITY_COLORS.get(rarity, "#8B949E")
 
-        ttk.Label(self._detail, text=name, font=("Segoe UI", 14, "bold"),
-                  foreground=color).pack(anchor="w", padx=PAD, pady=(PAD, 0))
-        ttk.Label(self._detail, text=rarity, font=("Segoe UI", 11),
-                  foreground=color).pack(anchor="w", padx=PAD)
-
-        ttk.Separator(self._detail).pack(fill="x", padx=PAD, pady=PAD)
-
-        ttk.Label(self._detail, text="Effect", font=("Segoe UI", 11, "bold"),
-                  bootstyle="info").pack(anchor="w", padx=PAD)
-        ttk.Label(self._detail, text=ess.get("effect", "N/A"),
-                  wraplength=350, font=("Segoe UI", 9)).pack(
-            anchor="w", padx=PAD * 2, pady=4)
+        self._name_lbl.configure(text=name, foreground=color)
+        self._rarity_lbl.configure(text=rarity, foreground=color)
+        self._effect_lbl.configure(text=ess.get("effect", "N/A"))
+        shown = [self._header_frame]
 
         types = ess.get("synergy_types", [])
         if types:
-            ttk.Label(self._detail, text="Synergy Types",
-                      font=("Segoe UI", 11, "bold"), bootstyle="info").pack(
-                anchor="w", padx=PAD, pady=(PAD, 0))
-            ttk.Label(self._detail, text=", ".join(types),
-                      font=("Segoe UI", 9)).pack(anchor="w", padx=PAD * 2)
-
-        # Builds using this essence
-        from analysis.build_comparator import BuildComparator
-        comp = BuildComparator(self.loader)
-        found = comp.find_builds_with_essence(name)
+            self._types_lbl.configure(text=", ".join(types))
+            shown.append(self._types_frame)
+
+        # Builds using this essence (memoized, re-clicks are common)
+        found = self._builds_with_essence.get(name)
+        if found is None:
+            found = self._comparator.find_builds_with_essence(name)
+            self._builds_with_essence[name] = found
         if found:
-            ttk.Separator(self._detail).pack(fill="x", padx=PAD, pady=PAD)
-            ttk.Label(self._detail, text=f"Used in {len(found)} build(s)",
-                      font=("Segoe UI", 11, "bold"), bootstyle="success").pack(
-                anchor="w", padx=PAD)
-            for item in found[:8]:
-                ttk.Label(self._detail,
-                          text=f"  {item['character'].capitalize()} - {item['build']}",
-                          font=("Segoe UI", 9)).pack(anchor="w", padx=PAD)
+            self._builds_lbl.configure(text=f"Used in {len(found)} build(s)")
+            self._builds_list.set_lines([
+                (f"  {item['character'].capitalize()} - {item['build']}", None)
+                for item in found[:8]
+            ])
+            shown.append(self._builds_frame)
 
         # Substitutes
-        from analysis.synergy_analyzer import SynergyAnalyzer
-        sa = SynergyAnalyzer(self.loader)
-        subs = sa.suggest_substitutes(name)
+        subs = self._synergy_analyzer.suggest_substitutes(name)
         if subs:
-            ttk.Separator(self._detail).pack(fill="x", padx=PAD, pady=PAD)
-            ttk.Label(self._detail, text="Substitutes",
-                      font=("Segoe UI", 11, "bold"), bootstyle="warning").pack(
-                anchor="w", padx=PAD)
-            for sub in subs[:5]:
-                sub_color = RARITY_COLORS.get(sub["rarity"], "#8B949E")
-                ttk.Label(self._detail,
-                          text=f"  {sub['essence']} ({sub['rarity']}) - {', '.join(sub['shared_types'])}",
-                          font=("Segoe UI", 9), foreground=sub_color).pack(
-                    anchor="w", padx=PAD)
+            self._subs_list.set_lines([
+                (f"  {sub['essence']} ({sub['rarity']}) - {', '.join(sub['shared_types'])}",
+                 sub["rarity"])
+                for sub in subs[:5]
+            ])
+            shown.append(self._subs_frame)
+
+        # Re-pack only the sections this essence needs, in order
+        for section in self._detail_sections:
+            section.pack_forget()
+        for section in shown:
+            section.pack(fill="x", anchor="w")
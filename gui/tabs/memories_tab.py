@@ -1,10 +1,14 @@
 """Memories tab - filterable memory catalog with detail panel."""
 
+import heapq
+
 import ttkbootstrap as ttk
 from ttkbootstrap.tableview import Tableview
 
-from gui.theme import PAD, PAD_SM, RARITY_COLORS
+from gui.theme import PAD, PAD_SM
+from gui.widgets.detail_list import DetailList
 from gui.widgets.search_bar import SearchBar
+from gui.widgets.table_filter import TableFilter
 
 
 class MemoriesTab(ttk.Frame):
@@ -13,6 +17,9 @@ class MemoriesTab(ttk.Frame):
         self.loader = loader
         self._all_rows = []
         self._memory_lookup = {}
+        self._essence_order = {}  # essence name -> catalog position
+        self._builds_by_memory = {}  # memory name -> [{character, build}]
+        self._row_by_iid = {}
 
         self._setup_ui()
         self._load_data()
@@ -23,7 +30,7 @@ class MemoriesTab(ttk.Frame):
         top.pack(fill="x", padx=PAD, pady=PAD)
 
         self._search = SearchBar(top, placeholder="Search memories...",
-                                 on_change=self._on_filter)
+                                 on_change=self._on_filter, delay=150)
         self._search.pack(side="left", fill="x", expand=True, padx=(0, PAD))
 
         ttk.Label(top, text="Keyword:").pack(side="left")
@@ -31,7 +38,7 @@ class MemoriesTab(ttk.Frame):
         self._keyword_menu = ttk.Combobox(top, textvariable=self._keyword_var,
                                           width=16, state="readonly")
         self._keyword_menu.pack(side="left", padx=PAD_SM)
-        self._keyword_menu.bind("<<ComboboxSelected>>", lambda _: self._on_filter())
+        self._keyword_menu.bind("<<ComboboxSelected>>", self._on_filter)
 
         # Paned: table | detail
         pane = ttk.Panedwindow(self, orient="horizontal")
@@ -51,19 +58,63 @@ class MemoriesTab(ttk.Frame):
                                 autofit=True, height=25)
         self._table.pack(fill="both", expand=True)
         self._table.view.bind("<<TreeviewSelect>>", self._on_select)
+        self._filter = TableFilter(self._table, on_resort=self._on_filter)
 
         # Right: detail
         self._detail = ttk.Frame(pane)
         pane.add(self._detail, weight=1)
+        self._setup_detail()
+
+    def _setup_detail(self):
+        """Create the detail widgets once; selections only reconfigure them."""
+        d = self._detail
+
+        self._header_frame = ttk.Frame(d)
+        self._name_lbl = ttk.Label(self._header_frame,
+                                   font=("Segoe UI", 14, "bold"),
+                                   bootstyle="light")
+        self._name_lbl.pack(anchor="w", padx=PAD, pady=(PAD, 0))
+        self._slots_lbl = ttk.Label(self._header_frame, font=("Segoe UI", 11),
+                                    bootstyle="secondary")
+        self._slots_lbl.pack(anchor="w", padx=PAD)
+        ttk.Separator(self._header_frame).pack(fill="x", padx=PAD, pady=PAD)
+        ttk.Label(self._header_frame, text="Effect",
+                  font=("Segoe UI", 11, "bold"), bootstyle="info").pack(
+            anchor="w", padx=PAD)
+        self._effect_lbl = ttk.Label(self._header_frame, wraplength=350,
+                                     font=("Segoe UI", 9))
+        self._effect_lbl.pack(anchor="w", padx=PAD * 2, pady=4)
+
+        self._keywords_frame = ttk.Frame(d)
+        ttk.Label(self._keywords_frame, text="Synergy Keywords",
+                  font=("Segoe UI", 11, "bold"), bootstyle="info").pack(
+            anchor="w", padx=PAD, pady=(PAD, 0))
+        self._keywords_lbl = ttk.Label(self._keywords_frame,
+                                       font=("Segoe UI", 9))
+        self._keywords_lbl.pack(anchor="w", padx=PAD * 2)
+
+        self._compatible_frame = ttk.Frame(d)
+        ttk.Separator(self._compatible_frame).pack(fill="x", padx=PAD, pady=PAD)
+        ttk.Label(self._compatible_frame, text="Compatible Essences",
+                  font=("Segoe UI", 11, "bold"), bootstyle="success").pack(
+            anchor="w", padx=PAD)
+        self._compatible_list = DetailList(self._compatible_frame)
+        self._compatible_list.pack(anchor="w", fill="x", padx=PAD)
+
+        self._builds_frame = ttk.Frame(d)
+        ttk.Separator(self._builds_frame).pack(fill="x", padx=PAD, pady=PAD)
+        self._builds_lbl = ttk.Label(self._builds_frame,
+                                     font=("Segoe UI", 11, "bold"),
+                                     bootstyle="success")
+        self._builds_lbl.pack(anchor="w", padx=PAD)
+        self._builds_list = DetailList(self._builds_frame)
+        self._builds_list.pack(anchor="w", fill="x", padx=PAD)
+
+        self._detail_sections = [self._header_frame, self._keywords_frame,
+                                 self._compatible_frame, self._builds_frame]
 
     def _load_data(self):
-        # Count memory usage in builds
-        usage = {}
-        for builds in self.loader.builds.values():
-            for build in builds:
-                for m in build.get("memories", []):
-                    name = m.get("name", "")
-                    usage[name] = usage.get(name, 0) + 1
+        usage = self.loader.memory_usage_counts
 
         # Collect all keywords
         all_keywords = set()
@@ -76,39 +127,56 @@ class MemoriesTab(ttk.Frame):
             keywords = mem.get("synergy_keywords", [])
             all_keywords.update(keywords)
             kw_str = ", ".join(keywords) if keywords else "-"
-            count = usage.get(name, 0)
-            self._all_rows.append((name, slots, kw_str, count))
+            count = usage[name]
+            # Display columns first, then lowercase search keys
+            self._all_rows.append((name, slots, kw_str, count, name.lower(),
+                                   kw_str.lower(), frozenset(keywords)))
             self._memory_lookup[name] = mem
 
+        # Catalog position breaks ties between equally compatible essences
+        self._essence_order = {
+            ess["name"]: order for order, ess in enumerate(self.loader.essences)
+        }
+
+        # Reverse index of builds per memory, each build listed once
+        self._builds_by_memory = {}
+        for char, builds in self.loader.builds.items():
+            for build in builds:
+                seen = set()
+                for m in build.get("memories", []):
+                    mem_name = m.get("name", "")
+                    if mem_name and mem_name not in seen:
+                        seen.add(mem_name)
+                        self._builds_by_memory.setdefault(mem_name, []).append(
+                            {"character": char, "build": build["name"]})
+
         # Populate keyword filter
         sorted_kw = ["All"] + sorted(all_keywords)
         self._keyword_menu.configure(values=sorted_kw)
 
+        # Insert every row once; filtering only detaches/reattaches items
+        self._table.delete_rows()
+        self._table.insert_rows("end", [row[:4] for row in self._all_rows])
+        self._table.load_table_data()
+        self._row_by_iid = {
+            table_row.iid: row
+            for table_row, row in zip(self._table.tablerows, self._all_rows)
+        }
+
+        self._filter.reset()
         self._on_filter()
 
-    def _on_filter(self, _query: str = ""):
+    def _on_filter(self, *_args):
         query = self._search.query.lower()
         keyword_filter = self._keyword_var.get()
 
-        filtered = []
-        for row in self._all_rows:
-            name, slots, kw_str, count = row
-
-            # Keyword filter
-            if keyword_filter != "All":
-                mem = self._memory_lookup.get(name)
-                if mem and keyword_filter not in mem.get("synergy_keywords", []):
-                    continue
+        def matches(iid):
+            name_lc, kw_lc, keyword_set = self._row_by_iid[iid][4:]
+            if keyword_filter != "All" and keyword_filter not in keyword_set:
+                return False
+            return not query or query in name_lc or query in kw_lc
 
-            # Search
-            if query and query not in name.lower() and query not in kw_str.lower():
-                continue
-
-            filtered.append(row)
-
-        self._table.delete_rows()
-        self._table.insert_rows("end", filtered)
-        self._table.load_table_data()
+        self._filter.set_filter((keyword_filter, query), matches)
 
     def _on_select(self, _event=None):
         selected = self._table.view.selection()
@@ -123,78 +191,57 @@ class MemoriesTab(ttk.Frame):
         if not mem:
             return
 
-        # Clear and rebuild detail
-        for w in self._detail.winfo_children():
-            w.destroy()
-
-        ttk.Label(self._detail, text=name, font=("Segoe UI", 14, "bold"),
-                  bootstyle="light").pack(anchor="w", padx=PAD, pady=(PAD, 0))
-
         slots = mem.get("essence_slots", 0)
-        ttk.Label(self._detail, text=f"Essence Slots: {slots}",
-                  font=("Segoe UI", 11), bootstyle="secondary").pack(
-            anchor="w", padx=PAD)
-
-        ttk.Separator(self._detail).pack(fill="x", padx=PAD, pady=PAD)
-
-        # Effect
         effect = mem.get("effect", mem.get("description", "N/A"))
-        ttk.Label(self._detail, text="Effect", font=("Segoe UI", 11, "bold"),
-                  bootstyle="info").pack(anchor="w", padx=PAD)
-        ttk.Label(self._detail, text=effect,
-                  wraplength=350, font=("Segoe UI", 9)).pack(
-            anchor="w", padx=PAD * 2, pady=4)
+        self._name_lbl.configure(text=name)
+        self._slots_lbl.configure(text=f"Essence Slots: {slots}")
+        self._effect_lbl.configure(text=effect)
+        shown = [self._header_frame]
 
-        # Synergy keywords
+        # Synergy keywords and compatible essences (ones matching keywords)
         keywords = mem.get("synergy_keywords", [])
         if keywords:
-            ttk.Label(self._detail, text="Synergy Keywords",
-                      font=("Segoe UI", 11, "bold"), bootstyle="info").pack(
-                anchor="w", padx=PAD, pady=(PAD, 0))
-            ttk.Label(self._detail, text=", ".join(keywords),
-                      font=("Segoe UI", 9)).pack(anchor="w", padx=PAD * 2)
-
-        # Compatible essences (ones matching keywords)
-        if keywords:
-            ttk.Separator(self._detail).pack(fill="x", padx=PAD, pady=PAD)
-            ttk.Label(self._detail, text="Compatible Essences",
-                      font=("Segoe UI", 11, "bold"), bootstyle="success").pack(
-                anchor="w", padx=PAD)
-
-            kw_set = set(keywords)
+            self._keywords_lbl.configure(text=", ".join(keywords))
+
+            kw_set = frozenset(keywords)
+            # The loader's type index means a selection only visits
+            # essences sharing at least one keyword
+            by_type = self.loader.essences_by_synergy_type
+            order_of = self._essence_order
+            candidates = {
+                order_of[ess["name"]]: ess
+                for kw in kw_set
+                for ess in by_type.get(kw, ())
+            }
+            # (-overlap size, catalog order, ...) sorts most overlap first,
+            # catalog order among ties; order is unique so ess is never compared
+            types_map = self.loader.essence_types_map
             compatible = []
-            for ess in self.loader.essences:
-                ess_types = set(ess.get("synergy_types", []))
-                overlap = kw_set.intersection(ess_types)
-                if overlap:
-                    compatible.append((ess, overlap))
-
-            compatible.sort(key=lambda x: len(x[1]), reverse=True)
-            for ess, overlap in compatible[:10]:
+            for order, ess in candidates.items():
+                overlap = kw_set & types_map[ess["name"]]
+                compatible.append((-len(overlap), order, ess, overlap))
+
+            lines = []
+            for _, _, ess, overlap in heapq.nsmallest(10, compatible):
                 rarity = ess.get("rarity", "Unknown")
-                color = RARITY_COLORS.get(rarity, "#8B949E")
-                ttk.Label(self._detail,
-                          text=f"  [{rarity[0]}] {ess['name']} ({', '.join(overlap)})",
-                          font=("Segoe UI", 9), foreground=color).pack(
-                    anchor="w", padx=PAD)
+                lines.append(
+                    (f"  [{rarity[0]}] {ess['name']} ({', '.join(overlap)})", rarity))
+            self._compatible_list.set_lines(lines)
+            shown += [self._keywords_frame, self._compatible_frame]
 
         # Builds using this memory
-        from analysis.build_comparator import BuildComparator
-        comp = BuildComparator(self.loader)
-        found = []
-        for char, builds in self.loader.builds.items():
-            for build in builds:
-                for m in build.get("memories", []):
-                    if m.get("name") == name:
-                        found.append({"character": char, "build": build["name"]})
-                        break
+        found = self._builds_by_memory.get(name, [])
 
         if found:
-            ttk.Separator(self._detail).pack(fill="x", padx=PAD, pady=PAD)
-            ttk.Label(self._detail, text=f"Used in {len(found)} build(s)",
-                      font=("Segoe UI", 11, "bold"), bootstyle="success").pack(
-                anchor="w", padx=PAD)
-            for item in found[:8]:
-                ttk.Label(self._detail,
-                          text=f"  {item['character'].capitalize()} - {item['build']}",
-                          font=("Segoe UI", 9)).pack(anchor="w", padx=PAD)
+            self._builds_lbl.configure(text=f"Used in {len(found)} build(s)")
+            self._builds_list.set_lines([
+                (f"  {item['character'].capitalize()} - {item['build']}", None)
+                for item in found[:8]
+            ])
+            shown.append(self._builds_frame)
+
+        # Re-pack only the sections this memory needs, in order
+        for section in self._detail_sections:
+            section.pack_forget()
+        for section in shown:
+            section.pack(fill="x", anchor="w")
@@ -12,6 +12,10 @@ class MetaTab(ttk.Frame):
         super().__init__(parent, **kwargs)
         self.loader = loader
         self.analyzer = analyzer
+        self._meta = None
+        self._essence_display = None
+        self._sections = []  # [(placeholder, builder)]
+        self._built = set()
 
         self._setup_ui()
 
@@ -26,10 +30,17 @@ class MetaTab(ttk.Frame):
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
         )
         canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+
+        def _on_yscroll(first, last):
+            scrollbar.set(first, last)
+            self._build_visible_sections()
+        canvas.configure(yscrollcommand=_on_yscroll)
+        canvas.bind("<Configure>", lambda e: self._build_visible_sections())
 
         def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            # Integer steps, truncated toward zero like the old float math
+            steps = abs(event.delta) // 120
+            canvas.yview_scroll(-steps if event.delta > 0 else steps, "units")
         canvas.bind("<Enter>",
                     lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
         canvas.bind("<Leave>",
@@ -39,6 +50,7 @@ class MetaTab(ttk.Frame):
         canvas.pack(side="left", fill="both", expand=True)
 
         f = scroll_frame
+        self._canvas = canvas
         self._content = f
 
         # Title
@@ -46,24 +58,69 @@ class MetaTab(ttk.Frame):
                   font=("Segoe UI", 16, "bold"), bootstyle="light").pack(
             anchor="w", padx=PAD_LG, pady=(PAD_LG, PAD))
 
-        self._build_overview(f)
-        self._character_comparison(f)
-        self._essence_usage(f)
-        self._unused_essences(f)
-        self._common_pairs(f)
+        # Sections are built the first time they scroll into view; the
+        # height is only a placeholder hint until then
+        self._add_section(120, lambda p: self._build_overview(p, self._get_meta()))
+        self._add_section(
+            60 + 28 * len(self.loader.character_names),
+            self._character_comparison)
+        self._add_section(600, lambda p: self._essence_usage(p, self._get_meta()))
+        self._add_section(300, lambda p: self._unused_essences(p, self._get_meta()))
+        self._add_section(400, self._common_pairs)
 
         # Bottom padding
         ttk.Label(f, text="").pack(pady=PAD_LG)
 
-    def _build_overview(self, f):
+    # ── Lazy sections ────────────────────────────────────────────────
+
+    def _add_section(self, height_hint, builder):
+        placeholder = ttk.Frame(self._content, height=height_hint)
+        placeholder.pack(fill="x")
+        self._sections.append((placeholder, builder))
+
+    def _get_meta(self):
+        """One usage report shared by every section except the pairs."""
+        if self._meta is None:
+            self._meta = self.analyzer.essence_meta_report_basic()
+        return self._meta
+
+    def _essence_label(self, name):
+        """("[R] Name" label text, rarity color) for an essence, built once."""
+        if self._essence_display is None:
+            self._essence_display = {}
+            for ess_name, rarity in self.loader.essence_rarity_map.items():
+                self._essence_display[ess_name] = (
+                    f"[{rarity[0]}] {ess_name}",
+                    RARITY_COLORS.get(rarity, "#8B949E"))
+        display = self._essence_display.get(name)
+        if display is None:
+            # Names missing from the catalog render as Unknown
+            display = (f"[U] {name}", RARITY_COLORS["Unknown"])
+        return display
+
+    def _build_visible_sections(self):
+        """Build any unbuilt section whose placeholder overlaps the viewport."""
+        # Nothing is laid out until the content frame has a real size
+        if (len(self._built) == len(self._sections)
+                or self._content.winfo_height() <= 1):
+            return
+        top = self._canvas.canvasy(0)
+        bottom = top + self._canvas.winfo_height()
+        for index, (placeholder, builder) in enumerate(self._sections):
+            if index in self._built:
+                continue
+            y = placeholder.winfo_y()
+            if y < bottom and y + placeholder.winfo_height() > top:
+                self._built.add(index)
+                builder(placeholder)
+
+    def _build_overview(self, f, meta):
         """Overall project statistics."""
         ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD)
         ttk.Label(f, text="Project Overview",
                   font=("Segoe UI", 14, "bold"), bootstyle="info").pack(
             anchor="w", padx=PAD_LG)
 
-        meta = self.analyzer.essence_meta_report()
-
         stats_frame = ttk.Frame(f)
         stats_frame.pack(fill="x", padx=PAD_LG, pady=PAD)
 
@@ -94,67 +151,42 @@ class MetaTab(ttk.Frame):
 
         comparison = self.analyzer.cross_character_comparison()
 
-        # Table header
-        header = ttk.Frame(f)
-        header.pack(fill="x", padx=PAD_LG, pady=(PAD, 0))
-        cols = ["Character", "Builds", "Avg Score", "Best", "Worst", "Coverage"]
-        widths = [120, 60, 80, 60, 60, 80]
-        for col, w in zip(cols, widths):
-            ttk.Label(header, text=col, font=("Segoe UI", 10, "bold"),
-                      width=w // 8, bootstyle="secondary").pack(side="left", padx=2)
-
-        ttk.Separator(f).pack(fill="x", padx=PAD_LG, pady=2)
-
         # Rows sorted by avg score
         sorted_chars = sorted(comparison.items(),
                               key=lambda x: x[1]["avg_score"], reverse=True)
 
-        for char, info in sorted_chars:
-            row = ttk.Frame(f)
-            row.pack(fill="x", padx=PAD_LG, pady=1)
-
-            ttk.Label(row, text=char.capitalize(),
-                      font=("Segoe UI", 10, "bold"),
-                      width=15).pack(side="left", padx=2)
-
-            ttk.Label(row, text=str(info["build_count"]),
-                      font=("Segoe UI", 10),
-                      width=7).pack(side="left", padx=2)
+        # One Treeview instead of a frame of labels per row; Treeview can
+        # only color whole rows, so each row takes its average-score color
+        cols = ("builds", "avg", "best", "worst", "cov")
+        table = ttk.Treeview(f, columns=cols, show="tree headings",
+                             height=max(1, len(sorted_chars)),
+                             selectmode="none")
+        table.heading("#0", text="Character", anchor="w")
+        table.column("#0", width=120, stretch=False)
+        for col, text, width in zip(
+                cols,
+                ["Builds", "Avg Score", "Best", "Worst", "Coverage"],
+                [60, 80, 60, 60, 80]):
+            table.heading(col, text=text)
+            table.column(col, width=width, anchor="center", stretch=False)
+        table.pack(anchor="w", padx=PAD_LG, pady=(PAD, 0))
 
+        for char, info in sorted_chars:
             avg = info["avg_score"]
             avg_color = score_color(int(avg))
-            ttk.Label(row, text=f"{avg:.1f}",
-                      font=("Segoe UI", 10),
-                      foreground=avg_color,
-                      width=10).pack(side="left", padx=2)
-
-            best_color = score_color(info["max_score"])
-            ttk.Label(row, text=str(info["max_score"]),
-                      font=("Segoe UI", 10),
-                      foreground=best_color,
-                      width=7).pack(side="left", padx=2)
-
-            worst_color = score_color(info["min_score"])
-            ttk.Label(row, text=str(info["min_score"]),
-                      font=("Segoe UI", 10),
-                      foreground=worst_color,
-                      width=7).pack(side="left", padx=2)
-
-            cov = info["archetype_coverage"]
-            cov_color = score_color(int(cov))
-            ttk.Label(row, text=f"{cov:.0f}%",
-                      font=("Segoe UI", 10),
-                      foreground=cov_color,
-                      width=10).pack(side="left", padx=2)
-
-    def _essence_usage(self, f):
+            table.tag_configure(avg_color, foreground=avg_color)
+            table.insert("", "end", text=char.capitalize(), tags=(avg_color,),
+                         values=(info["build_count"], f"{avg:.1f}",
+                                 info["max_score"], info["min_score"],
+                                 f"{info['archetype_coverage']:.0f}%"))
+
+    def _essence_usage(self, f, meta):
         """Most used essences with horizontal bars."""
         ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD)
         ttk.Label(f, text="Most Used Essences",
                   font=("Segoe UI", 14, "bold"), bootstyle="info").pack(
             anchor="w", padx=PAD_LG)
 
-        meta = self.analyzer.essence_meta_report()
         most_used = meta["most_used"][:15]
 
         if not most_used:
@@ -164,30 +196,35 @@ class MetaTab(ttk.Frame):
 
         max_count = most_used[0][1] if most_used else 1
 
-        for name, count in most_used:
-            row = ttk.Frame(f)
-            row.pack(fill="x", padx=PAD_LG, pady=1)
-
-            rarity = self.loader.essence_rarity_map.get(name, "Unknown")
-            color = RARITY_COLORS.get(rarity, "#8B949E")
-
-            ttk.Label(row, text=f"[{rarity[0]}] {name}",
-                      font=("Segoe UI", 9), foreground=color,
-                      width=30, anchor="w").pack(side="left")
-
-            # Bar
-            bar_width = 200
-            bar = tk.Canvas(row, width=bar_width, height=14, highlightthickness=0)
-            bar.pack(side="left", padx=PAD_SM)
-            bar.create_rectangle(0, 0, bar_width, 14,
-                                 fill="#21262D", outline="#30363D")
+        # One canvas for every row: name, bar and count are canvas items,
+        # so the columns stay aligned without a widget per row
+        name_width, bar_width, count_width = 230, 200, 40
+        row_height, bar_height = 18, 14
+        bar_x = name_width + PAD_SM
+        count_x = bar_x + bar_width + PAD_SM
+        text_color = ttk.Style().colors.fg
+        chart = tk.Canvas(f, width=count_x + count_width,
+                          height=row_height * len(most_used),
+                          highlightthickness=0)
+        chart.pack(anchor="w", padx=PAD_LG, pady=1)
+
+        for i, (name, count) in enumerate(most_used):
+            label, color = self._essence_label(name)
+            y = i * row_height
+            mid = y + row_height // 2
+
+            chart.create_text(0, mid, text=label, anchor="w",
+                              font=("Segoe UI", 9), fill=color)
+            chart.create_rectangle(bar_x, y + 2, bar_x + bar_width,
+                                   y + 2 + bar_height,
+                                   fill="#21262D", outline="#30363D")
             fill_w = int(bar_width * count / max_count)
             if fill_w > 0:
-                bar.create_rectangle(0, 0, fill_w, 14, fill=color, outline="")
-
-            ttk.Label(row, text=f"x{count}",
-                      font=("Segoe UI", 9, "bold"),
-                      width=5).pack(side="left")
+                chart.create_rectangle(bar_x, y + 2, bar_x + fill_w,
+                                       y + 2 + bar_height,
+                                       fill=color, outline="")
+            chart.create_text(count_x, mid, text=f"x{count}", anchor="w",
+                              font=("Segoe UI", 9, "bold"), fill=text_color)
 
         # Rarity breakdown
         ttk.Label(f, text="Usage by Rarity",
@@ -206,14 +243,13 @@ class MetaTab(ttk.Frame):
                       font=("Segoe UI", 9), foreground=color).pack(
                 anchor="w", padx=PAD_LG)
 
-    def _unused_essences(self, f):
+    def _unused_essences(self, f, meta):
         """List of essences not used in any build."""
         ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD)
         ttk.Label(f, text="Unused Essences",
                   font=("Segoe UI", 14, "bold"), bootstyle="danger").pack(
             anchor="w", padx=PAD_LG)
 
-        meta = self.analyzer.essence_meta_report()
         unused = meta.get("unused_essences", [])
 
         if not unused:
@@ -230,15 +266,15 @@ class MetaTab(ttk.Frame):
         col_frame = ttk.Frame(f)
         col_frame.pack(fill="x", padx=PAD_LG)
 
-        per_col = max(1, (len(unused) + 2) // 3)
-        for col_idx in range(3):
+        # Label text and color per essence, then slice into columns
+        decorated = [self._essence_label(name) for name in unused]
+
+        per_col = max(1, -(-len(decorated) // 3))
+        for start in range(0, per_col * 3, per_col):
             col = ttk.Frame(col_frame)
             col.pack(side="left", fill="y", expand=True, anchor="n")
-            start = col_idx * per_col
-            for name in unused[start:start + per_col]:
-                rarity = self.loader.essence_rarity_map.get(name, "Unknown")
-                color = RARITY_COLORS.get(rarity, "#8B949E")
-                ttk.Label(col, text=f"[{rarity[0]}] {name}",
+            for text, color in decorated[start:start + per_col]:
+                ttk.Label(col, text=text,
                           font=("Segoe UI", 9), foreground=color).pack(
                     anchor="w", padx=PAD_SM)
 
@@ -252,8 +288,9 @@ class MetaTab(ttk.Frame):
                   font=("Segoe UI", 10), bootstyle="secondary").pack(
             anchor="w", padx=PAD_LG, pady=(0, PAD_SM))
 
-        meta = self.analyzer.essence_meta_report()
-        pairs = meta.get("most_common_pairs", [])
+        # Co-occurrence is the costly part of the report, so it is only
+        # computed once this section scrolls into view
+        pairs = self.analyzer.essence_meta_report_pairs()
 
         if not pairs:
             ttk.Label(f, text="No pair data available",
@@ -261,20 +298,10 @@ class MetaTab(ttk.Frame):
             return
 
         for p in pairs[:10]:
-            pair_names = p["pair"]
-            count = p["count"]
-
             row = ttk.Frame(f)
             row.pack(fill="x", padx=PAD_LG, pady=1)
 
-            # Color each essence by rarity
-            text_parts = []
-            for name in pair_names:
-                rarity = self.loader.essence_rarity_map.get(name, "Unknown")
-                text_parts.append(f"[{rarity[0]}] {name}")
-
-            pair_text = "  +  ".join(text_parts)
-            ttk.Label(row, text=pair_text,
+            ttk.Label(row, text=p["display"],
                       font=("Segoe UI", 10)).pack(side="left")
-            ttk.Label(row, text=f"  (in {count} builds)",
+            ttk.Label(row, text=f"  (in {p['count']} builds)",
                       font=("Segoe UI", 9), bootstyle="secondary").pack(side="left")
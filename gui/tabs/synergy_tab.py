@@ -1,6 +1,5 @@
 """Synergy tab - synergy pair browser, calculator, and substitute finder."""
 
-import tkinter as tk
 import ttkbootstrap as ttk
 from ttkbootstrap.tableview import Tableview
 
@@ -8,11 +7,13 @@ from gui.theme import PAD, PAD_SM, RARITY_COLORS
 from gui.widgets.search_bar import SearchBar
 
 from analysis.synergies import (
-    ESSENCE_SYNERGIES,
+    ESSENCE_SYNERGY_AVG,
+    ESSENCE_SYNERGY_MAX,
+    ESSENCE_SYNERGY_TOTAL,
     SYNERGY_CATEGORIES,
-    SOLO_ESSENCE_SCORES,
     score_essence_set,
     find_all_synergies_in_set,
+    sorted_pairs_rows,
 )
 
 
@@ -20,6 +21,8 @@ class SynergyTab(ttk.Frame):
     def __init__(self, parent, loader, **kwargs):
         super().__init__(parent, **kwargs)
         self.loader = loader
+        self._tab_builders = {}  # frame -> builder, run on first visit
+        self._built = set()
 
         self._setup_ui()
 
@@ -35,12 +38,24 @@ class SynergyTab(ttk.Frame):
         # Tab 2: Synergy calculator
         self._calc_frame = ttk.Frame(notebook)
         notebook.add(self._calc_frame, text="Calculator")
-        self._setup_calc_tab()
 
         # Tab 3: Categories
         self._cat_frame = ttk.Frame(notebook)
         notebook.add(self._cat_frame, text="Categories")
-        self._setup_categories_tab()
+
+        # Only the default tab is built up front
+        self._tab_builders = {
+            str(self._calc_frame): self._setup_calc_tab,
+            str(self._cat_frame): self._setup_categories_tab,
+        }
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        selected = event.widget.select()
+        builder = self._tab_builders.get(selected)
+        if builder and selected not in self._built:
+            self._built.add(selected)
+            builder()
 
     def _setup_pairs_tab(self):
         """Show all known synergy pairs in a table."""
@@ -51,28 +66,17 @@ class SynergyTab(ttk.Frame):
             {"text": "Description", "stretch": True, "width": 350},
         ]
 
-        rows = []
-        for (e1, e2), info in ESSENCE_SYNERGIES.items():
-            rows.append((e1, e2, info["score"], info["description"]))
-
-        # Add solo essences
-        for name, score in SOLO_ESSENCE_SCORES.items():
-            rows.append((name, "(standalone)", score, f"{name} provides standalone value"))
-
-        # Sort by score descending
-        rows.sort(key=lambda r: r[2], reverse=True)
-
-        table = Tableview(self._pairs_frame, coldata=cols, rowdata=rows,
+        table = Tableview(self._pairs_frame, coldata=cols,
+                          rowdata=sorted_pairs_rows(),
                           paginated=False, searchable=False,
                           autofit=True, height=20)
         table.pack(fill="both", expand=True, padx=PAD, pady=PAD)
 
         # Summary
-        total_pairs = len(ESSENCE_SYNERGIES) + len(SOLO_ESSENCE_SCORES)
         ttk.Label(self._pairs_frame,
-                  text=f"{total_pairs} known synergies  |  "
-                       f"Max pair score: {max(i['score'] for i in ESSENCE_SYNERGIES.values())}  |  "
-                       f"Avg pair score: {sum(i['score'] for i in ESSENCE_SYNERGIES.values()) // len(ESSENCE_SYNERGIES)}",
+                  text=f"{ESSENCE_SYNERGY_TOTAL} known synergies  |  "
+                       f"Max pair score: {ESSENCE_SYNERGY_MAX}  |  "
+                       f"Avg pair score: {ESSENCE_SYNERGY_AVG}",
                   font=("Segoe UI", 9), bootstyle="secondary").pack(
             anchor="w", padx=PAD, pady=(0, PAD))
 
@@ -93,7 +97,8 @@ class SynergyTab(ttk.Frame):
         left.pack(side="left", fill="both", expand=True, padx=(0, PAD_SM))
 
         self._search_calc = SearchBar(left, placeholder="Filter essences...",
-                                      on_change=self._filter_available)
+                                      on_change=self._filter_available,
+                                      delay=120)
         self._search_calc.pack(fill="x", padx=PAD_SM, pady=PAD_SM)
 
         self._available_list = ttk.Treeview(left, columns=("name", "rarity"),
@@ -136,25 +141,52 @@ class SynergyTab(ttk.Frame):
                                        bootstyle="secondary")
         self._result_label.pack(anchor="w", padx=PAD, pady=PAD)
 
+        # Result widgets are built once; _calculate only reconfigures them
+        self._score_label = ttk.Label(self._result_frame,
+                                      font=("Segoe UI", 14, "bold"))
+        self._count_label = ttk.Label(self._result_frame,
+                                      font=("Segoe UI", 10),
+                                      bootstyle="secondary")
+        self._synergy_container = ttk.Frame(self._result_frame)
+        ttk.Separator(self._synergy_container).pack(fill="x", padx=PAD, pady=PAD)
+        ttk.Label(self._synergy_container, text="Active Synergies:",
+                  font=("Segoe UI", 11, "bold"), bootstyle="success").pack(
+            anchor="w", padx=PAD)
+        self._synergy_row_pool = []  # (row frame, pair label, description label)
+
+        # Every essence is inserted once (iid = name); filtering only
+        # detaches and reattaches rows
+        self._names_lc = [(ess["name"], ess["name"].lower())
+                          for ess in self.loader.essences]
+        for ess in self.loader.essences:
+            self._available_list.insert("", "end", iid=ess["name"],
+                                        values=(ess["name"],
+                                                ess.get("rarity", "Unknown")))
+
         # Load available essences
         self._selected_essences = set()
+        self._refresh_token = 0  # bumped per refresh; stale chunkers stop
         self._load_available()
 
     def _load_available(self):
         if not hasattr(self, "_available_list"):
             return
-        for item in self._available_list.get_children():
-            self._available_list.delete(item)
 
         query = self._search_calc.query.lower() if hasattr(self, "_search_calc") else ""
-        for ess in self.loader.essences:
-            name = ess["name"]
-            if name in self._selected_essences:
-                continue
-            if query and query not in name.lower():
-                continue
-            rarity = ess.get("rarity", "Unknown")
-            self._available_list.insert("", "end", values=(name, rarity))
+        selected = self._selected_essences
+        wanted = [name for name, name_lc in self._names_lc
+                  if name not in selected and (not query or query in name_lc)]
+
+        # Only touch rows whose visibility changed
+        tree = self._available_list
+        shown = set(tree.get_children())
+        keep = set(wanted)
+        hidden = [iid for iid in shown if iid not in keep]
+        if hidden:
+            tree.detach(*hidden)
+        for index, name in enumerate(wanted):
+            if name not in shown:
+                tree.reattach(name, "", index)
 
     def _filter_available(self, _query=""):
         self._load_available()
@@ -192,79 +224,84 @@ class SynergyTab(ttk.Frame):
         self._calculate()
 
     def _refresh_selected(self):
-        for item in self._selected_list.get_children():
-            self._selected_list.delete(item)
-        for name in sorted(self._selected_essences):
-            rarity = self.loader.essence_rarity_map.get(name, "Unknown")
-            self._selected_list.insert("", "end", values=(name, rarity))
+        children = self._selected_list.get_children()
+        if children:
+            self._selected_list.delete(*children)
+        # Insert in small batches on idle so a large "Add" doesn't block
+        self._refresh_token += 1
+        self.after_idle(self._insert_selected_chunk, self._refresh_token,
+                        iter(sorted(self._selected_essences)), 20)
+
+    def _insert_selected_chunk(self, token, names, n):
+        if token != self._refresh_token:
+            return  # superseded by a newer refresh
+        rarity_map = self.loader.essence_rarity_map
+        for _ in range(n):
+            name = next(names, None)
+            if name is None:
+                return
+            self._selected_list.insert("", "end",
+                                       values=(name, rarity_map.get(name, "Unknown")))
+        self.after_idle(self._insert_selected_chunk, token, names, n)
 
     def _calculate(self):
-        # Clear results
-        for w in self._result_frame.winfo_children():
-            w.destroy()
-
         if not self._selected_essences:
-            ttk.Label(self._result_frame,
-                      text="Add essences to see synergy analysis",
-                      font=("Segoe UI", 10), bootstyle="secondary").pack(
-                anchor="w", padx=PAD, pady=PAD)
+            self._score_label.pack_forget()
+            self._count_label.pack_forget()
+            self._synergy_container.pack_forget()
+            self._result_label.pack(anchor="w", padx=PAD, pady=PAD)
             return
 
-        score = score_essence_set(self._selected_essences)
-        synergies = find_all_synergies_in_set(self._selected_essences)
+        selected = frozenset(self._selected_essences)
+        score = score_essence_set(selected)
+        synergies = find_all_synergies_in_set(selected)
 
         # Score display
         score_color_val = "#3FB950" if score >= 40 else (
             "#58A6FF" if score >= 20 else (
                 "#D29922" if score >= 10 else "#F85149"))
 
-        ttk.Label(self._result_frame,
-                  text=f"Total Synergy Score: {score}",
-                  font=("Segoe UI", 14, "bold"),
-                  foreground=score_color_val).pack(anchor="w", padx=PAD, pady=(PAD, PAD_SM))
-
-        ttk.Label(self._result_frame,
-                  text=f"{len(self._selected_essences)} essences selected, "
-                       f"{len(synergies)} synergies found",
-                  font=("Segoe UI", 10), bootstyle="secondary").pack(
-            anchor="w", padx=PAD)
+        self._result_label.pack_forget()
+        self._score_label.configure(text=f"Total Synergy Score: {score}",
+                                    foreground=score_color_val)
+        self._score_label.pack(anchor="w", padx=PAD, pady=(PAD, PAD_SM))
+        self._count_label.configure(
+            text=f"{len(self._selected_essences)} essences selected, "
+                 f"{len(synergies)} synergies found")
+        self._count_label.pack(anchor="w", padx=PAD)
+
+        if not synergies:
+            self._synergy_container.pack_forget()
+            return
 
-        if synergies:
-            ttk.Separator(self._result_frame).pack(fill="x", padx=PAD, pady=PAD)
-            ttk.Label(self._result_frame, text="Active Synergies:",
-                      font=("Segoe UI", 11, "bold"), bootstyle="success").pack(
-                anchor="w", padx=PAD)
-
-            for s in synergies:
-                pair_str = " + ".join(s["pair"])
-                ttk.Label(self._result_frame,
-                          text=f"  [{s['score']}pts] {pair_str}",
-                          font=("Segoe UI", 10, "bold"),
-                          foreground="#E3B341").pack(anchor="w", padx=PAD)
-                if s.get("description"):
-                    ttk.Label(self._result_frame,
-                              text=f"    {s['description']}",
-                              font=("Segoe UI", 8), bootstyle="secondary",
-                              wraplength=500).pack(anchor="w", padx=PAD * 2)
+        # Reuse pooled rows; create only when the pool is too small
+        pool = self._synergy_row_pool
+        for i, s in enumerate(synergies):
+            if i < len(pool):
+                row, pair_lbl, desc_lbl = pool[i]
+            else:
+                row = ttk.Frame(self._synergy_container)
+                pair_lbl = ttk.Label(row, font=("Segoe UI", 10, "bold"),
+                                     foreground="#E3B341")
+                pair_lbl.pack(anchor="w", padx=PAD)
+                desc_lbl = ttk.Label(row, font=("Segoe UI", 8),
+                                     bootstyle="secondary", wraplength=500)
+                pool.append((row, pair_lbl, desc_lbl))
+            pair_str = " + ".join(s["pair"])
+            pair_lbl.configure(text=f"  [{s['score']}pts] {pair_str}")
+            if s.get("description"):
+                desc_lbl.configure(text=f"    {s['description']}")
+                desc_lbl.pack(anchor="w", padx=PAD * 2)
+            else:
+                desc_lbl.pack_forget()
+            row.pack(fill="x")
+        for row, _pair_lbl, _desc_lbl in pool[len(synergies):]:
+            row.pack_forget()
+        self._synergy_container.pack(fill="x")
 
     def _setup_categories_tab(self):
         """Show synergy categories and which essences belong to each."""
-        canvas = tk.Canvas(self._cat_frame, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self._cat_frame, orient="vertical",
-                                  command=canvas.yview)
-        scroll_frame = ttk.Frame(canvas)
-
-        scroll_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        scrollbar.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-
-        f = scroll_frame
+        f = self._cat_frame
 
         ttk.Label(f, text="Synergy Categories",
                   font=("Segoe UI", 14, "bold"), bootstyle="light").pack(
@@ -274,38 +311,57 @@ class SynergyTab(ttk.Frame):
                   font=("Segoe UI", 10), bootstyle="secondary",
                   wraplength=600).pack(anchor="w", padx=PAD, pady=(0, PAD))
 
-        for cat_name, types in sorted(SYNERGY_CATEGORIES.items()):
-            ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD_SM)
+        # One Treeview instead of a label per essence; children are only
+        # drawn once their category is expanded.
+        tree_frame = ttk.Frame(f)
+        tree_frame.pack(fill="both", expand=True, padx=PAD, pady=(0, PAD))
+        tree = ttk.Treeview(tree_frame, columns=("types",),
+                            show="tree headings")
+        tree.heading("#0", text="Category / Essence", anchor="w")
+        tree.column("#0", width=260, stretch=False)
+        tree.heading("types", text="Synergy Types", anchor="w")
+        tree.column("types", width=400)
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical",
+                                  command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        tree.pack(side="left", fill="both", expand=True)
+
+        for rarity, color in RARITY_COLORS.items():
+            tree.tag_configure(rarity, foreground=color)
+        tree.tag_configure("category", font=("Segoe UI", 10, "bold"))
+        tree.tag_configure("empty", foreground="#8B949E")
 
+        by_type = self.loader.essences_by_synergy_type
+        position = {e["name"]: i for i, e in enumerate(self.loader.essences)}
+        types_text = {}  # essence name -> joined synergy types
+
+        for cat_name, types in sorted(SYNERGY_CATEGORIES.items()):
             cat_label = cat_name.replace("_", " ").title()
-            ttk.Label(f, text=cat_label,
-                      font=("Segoe UI", 12, "bold"), bootstyle="info").pack(
-                anchor="w", padx=PAD)
-            ttk.Label(f, text=f"Types: {', '.join(types)}",
-                      font=("Segoe UI", 9), bootstyle="secondary").pack(
-                anchor="w", padx=PAD * 2)
-
-            # Find essences matching this category
-            type_set = set(types)
-            matching = []
-            for ess in self.loader.essences:
-                ess_types = set(ess.get("synergy_types", []))
-                overlap = type_set & ess_types
-                if overlap:
-                    matching.append(ess)
+            parent = tree.insert("", "end", text=cat_label,
+                                 values=(", ".join(types),),
+                                 open=False, tags=("category",))
+
+            # Union the per-type index, then restore catalog order
+            candidates = {}
+            for t in types:
+                for ess in by_type.get(t, []):
+                    candidates.setdefault(ess["name"], ess)
+            matching = sorted(candidates.values(),
+                              key=lambda e: position[e["name"]])
 
             if matching:
                 for ess in matching[:12]:
                     rarity = ess.get("rarity", "Unknown")
-                    color = RARITY_COLORS.get(rarity, "#8B949E")
-                    ess_types = ", ".join(ess.get("synergy_types", []))
-                    ttk.Label(f,
-                              text=f"  [{rarity[0]}] {ess['name']} - {ess_types}",
-                              font=("Segoe UI", 9), foreground=color).pack(
-                        anchor="w", padx=PAD * 2)
+                    # Unrecognised rarities fall back to the Common grey
+                    tag = rarity if rarity in RARITY_COLORS else "Common"
+                    ess_types = types_text.get(ess["name"])
+                    if ess_types is None:
+                        ess_types = ", ".join(ess.get("synergy_types", []))
+                        types_text[ess["name"]] = ess_types
+                    tree.insert(parent, "end",
+                                text=f"[{rarity[0]}] {ess['name']}",
+                                values=(ess_types,), tags=(tag,))
             else:
-                ttk.Label(f, text="  (no matching essences)",
-                          font=("Segoe UI", 9), bootstyle="secondary").pack(
-                    anchor="w", padx=PAD * 2)
-
-        ttk.Label(f, text="").pack(pady=PAD)
+                tree.insert(parent, "end", text="(no matching essences)",
+                            tags=("empty",))
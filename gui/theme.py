@@ -3,6 +3,8 @@ Theme constants and style configuration for the GUI.
 ARPG-standard rarity colors, score gradients, and layout constants.
 """
 
+from bisect import bisect_right
+
 # Rarity colors (ARPG convention)
 RARITY_COLORS = {
     "Common": "#8B949E",
@@ -13,17 +15,24 @@ RARITY_COLORS = {
     "Unknown": "#484F58",
 }
 
-# Score-to-color gradient
+# Score-to-color gradient: red < 21 <= orange < 41 <= amber < 61 <= blue < 81 <= green
+_SCORE_BREAKS = (21, 41, 61, 81)
+_SCORE_COLORS = (
+    "#F85149",  # red
+    "#F0883E",  # orange
+    "#D29922",  # amber
+    "#58A6FF",  # blue
+    "#3FB950",  # green
+)
+
+# One entry per whole score 0-100; the breaks are whole numbers, so the
+# integer part of any score picks the same color
+_SCORE_COLOR_TABLE = tuple(
+    _SCORE_COLORS[bisect_right(_SCORE_BREAKS, i)] for i in range(101)
+)
+
 def score_color(score: int) -> str:
-    if score >= 81:
-        return "#3FB950"  # green
-    elif score >= 61:
-        return "#58A6FF"  # blue
-    elif score >= 41:
-        return "#D29922"  # amber
-    elif score >= 21:
-        return "#F0883E"  # orange
-    return "#F85149"  # red
+    return _SCORE_COLOR_TABLE[int(max(0, min(100, score)))]
 
 # Grade-to-color
 GRADE_COLORS = {
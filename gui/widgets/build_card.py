@@ -2,27 +2,43 @@
 
 import tkinter as tk
 import ttkbootstrap as ttk
-from gui.theme import (RARITY_COLORS, GRADE_COLORS, score_color,
+from gui.theme import (GRADE_COLORS, score_color,
                        PAD, PAD_SM, CUSTOM_BUILD_COLOR)
+from gui.widgets.detail_list import DetailList
 from gui.widgets.score_bar import ScoreBar
 
 
+def _add_bindtag(widget, tag):
+    """Give *widget* and all its descendants *tag* as their first bindtag."""
+    tags = widget.bindtags()
+    if tag not in tags:
+        widget.bindtags((tag,) + tags)
+    for child in widget.winfo_children():
+        _add_bindtag(child, tag)
+
+
 class BuildDetailPanel(ttk.Frame):
     """Right-side panel showing full build detail when a build is selected."""
 
+    # Shared font tuples (one allocation instead of one per widget)
+    FONT_8 = ("Segoe UI", 8)
+    FONT_9 = ("Segoe UI", 9)
+    FONT_9_BOLD = ("Segoe UI", 9, "bold")
+    FONT_10 = ("Segoe UI", 10)
+    FONT_10_BOLD = ("Segoe UI", 10, "bold")
+    FONT_11 = ("Segoe UI", 11)
+    FONT_11_BOLD = ("Segoe UI", 11, "bold")
+    FONT_12 = ("Segoe UI", 12)
+    FONT_14_BOLD = ("Segoe UI", 14, "bold")
+    FONT_16_BOLD = ("Segoe UI", 16, "bold")
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
-        self._widgets = []
-
-    def clear(self):
-        for w in self._widgets:
-            w.destroy()
-        self._widgets = []
-
-    def show_build(self, build: dict, char_name: str, loader, analyzer):
-        """Populate the panel with a build's full details."""
-        self.clear()
+        self._setup_ui()
 
+    def _setup_ui(self):
+        """Create the scroll area and every section once; show_build only
+        reconfigures them."""
         canvas = tk.Canvas(self, highlightthickness=0)
         scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
         scroll_frame = ttk.Frame(canvas)
@@ -34,37 +50,169 @@ class BuildDetailPanel(ttk.Frame):
         canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
-        # Mouse wheel scrolling - scoped to when mouse is over this panel
+        # Mouse wheel scrolling - a bindtag shared by every widget in this
+        # panel, bound once, instead of bind_all/unbind_all on each hover
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        canvas.bind("<Enter>",
-                    lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
-        canvas.bind("<Leave>",
-                    lambda e: canvas.unbind_all("<MouseWheel>"))
-        scroll_frame.bind("<Enter>",
-                          lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
-        scroll_frame.bind("<Leave>",
-                          lambda e: canvas.unbind_all("<MouseWheel>"))
-
-        scrollbar.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-        self._widgets.extend([canvas, scrollbar])
+            return "break"  # keep the Text blocks from scrolling themselves
+        wheel_tag = f"{self}.wheel"
+        self.bind_class(wheel_tag, "<MouseWheel>", _on_mousewheel)
 
+        self._canvas = canvas
+        self._scrollbar = scrollbar
         f = scroll_frame
 
+        # Header
+        self._header = ttk.Frame(f)
+        self._custom_lbl = ttk.Label(self._header, text="CUSTOM BUILD",
+                                     font=self.FONT_9_BOLD,
+                                     foreground=CUSTOM_BUILD_COLOR)
+        self._name_lbl = ttk.Label(self._header, font=self.FONT_16_BOLD,
+                                   bootstyle="light")
+        self._name_lbl.pack(anchor="w", padx=PAD)
+        self._char_lbl = ttk.Label(self._header, font=self.FONT_11,
+                                   bootstyle="secondary")
+        self._char_lbl.pack(anchor="w", padx=PAD)
+
+        # Score
+        self._score_section = ttk.Frame(f)
+        sf = ttk.Frame(self._score_section)
+        sf.pack(anchor="w", padx=PAD, pady=(PAD, 0))
+        ttk.Label(sf, text=f"Grade: ", font=self.FONT_12).pack(side="left")
+        self._grade_lbl = ttk.Label(sf, font=self.FONT_14_BOLD)
+        self._grade_lbl.pack(side="left")
+        self._score_lbl = ttk.Label(sf, font=self.FONT_12)
+        self._score_lbl.pack(side="left")
+
+        self._score_bar = ScoreBar(self._score_section, width=200, height=18)
+        self._score_bar.pack(anchor="w", padx=PAD, pady=PAD_SM)
+
+        # Breakdown
+        self._breakdown = []  # [(key, max, ScoreBar, value label)]
+        for label, key, mx in [
+            ("Synergy", "synergy", 40),
+            ("Rarity", "rarity", 20),
+            ("Validity", "validity", 20),
+            ("Completeness", "completeness", 20),
+        ]:
+            row = ttk.Frame(self._score_section)
+            row.pack(anchor="w", padx=PAD * 2, fill="x")
+            ttk.Label(row, text=f"{label}:", width=14,
+                      font=self.FONT_9).pack(side="left")
+            mini = ScoreBar(row, width=100, height=12)
+            mini.pack(side="left", padx=PAD_SM)
+            val_lbl = ttk.Label(row, font=self.FONT_9)
+            val_lbl.pack(side="left")
+            self._breakdown.append((key, mx, mini, val_lbl))
+
+        # Concept & Playstyle
+        self._concept_section = ttk.Frame(f)
+        ttk.Separator(self._concept_section).pack(fill="x", padx=PAD, pady=PAD)
+        ttk.Label(self._concept_section, text="Concept",
+                  font=self.FONT_11_BOLD,
+                  bootstyle="info").pack(anchor="w", padx=PAD)
+        self._concept_lbl = ttk.Label(self._concept_section, wraplength=400,
+                                      font=self.FONT_10)
+        self._concept_lbl.pack(anchor="w", padx=PAD * 2, pady=PAD_SM)
+        ttk.Label(self._concept_section, text="Playstyle",
+                  font=self.FONT_11_BOLD,
+                  bootstyle="info").pack(anchor="w", padx=PAD)
+        self._playstyle_lbl = ttk.Label(self._concept_section, wraplength=400,
+                                        font=self.FONT_10)
+        self._playstyle_lbl.pack(anchor="w", padx=PAD * 2, pady=PAD_SM)
+
+        # Memories & Essences
+        self._memories_section = ttk.Frame(f)
+        ttk.Separator(self._memories_section).pack(fill="x", padx=PAD, pady=PAD)
+        self._memories_lbl = ttk.Label(self._memories_section,
+                                       font=self.FONT_11_BOLD,
+                                       bootstyle="info")
+        self._memories_lbl.pack(anchor="w", padx=PAD)
+        self._memories_text = self._text_block(self._memories_section)
+
+        # Synergies
+        self._synergy_section = ttk.Frame(f)
+        ttk.Separator(self._synergy_section).pack(fill="x", padx=PAD, pady=PAD)
+        ttk.Label(self._synergy_section, text="Active Synergies",
+                  font=self.FONT_11_BOLD, bootstyle="success").pack(
+            anchor="w", padx=PAD)
+        self._synergy_text = self._text_block(self._synergy_section)
+
+        # Strengths & Weaknesses (headers are text lines, both are optional)
+        self._traits_section = ttk.Frame(f)
+        ttk.Separator(self._traits_section).pack(fill="x", padx=PAD, pady=PAD)
+        self._traits_text = self._text_block(self._traits_section)
+
+        # Strategy
+        self._strategy_section = ttk.Frame(f)
+        ttk.Separator(self._strategy_section).pack(fill="x", padx=PAD, pady=PAD)
+        ttk.Label(self._strategy_section, text="Strategy",
+                  font=self.FONT_11_BOLD,
+                  bootstyle="info").pack(anchor="w", padx=PAD)
+        self._strategy_lbl = ttk.Label(self._strategy_section, wraplength=400,
+                                       font=self.FONT_9)
+        self._strategy_lbl.pack(anchor="w", padx=PAD * 2, pady=PAD_SM)
+
+        # Improvements
+        self._improvements_section = ttk.Frame(f)
+        ttk.Separator(self._improvements_section).pack(fill="x", padx=PAD, pady=PAD)
+        ttk.Label(self._improvements_section, text="Suggested Improvements",
+                  font=self.FONT_11_BOLD, bootstyle="warning").pack(
+            anchor="w", padx=PAD)
+        self._improvements_text = self._text_block(self._improvements_section)
+
+        # Bottom padding
+        self._bottom_pad = ttk.Label(f, text="")
+
+        self._sections = [
+            self._header, self._score_section, self._concept_section,
+            self._memories_section, self._synergy_section,
+            self._traits_section, self._strategy_section,
+            self._improvements_section,
+        ]
+        _add_bindtag(canvas, wheel_tag)
+
+    def _text_block(self, parent):
+        """One wrapped, read-only Text for a section's lines (instead of a
+        label per line), with every line style the panel uses."""
+        colors = ttk.Style().colors
+        text = DetailList(parent, font=self.FONT_9, wrap="word", width=60)
+        text.add_tag("memory", font=self.FONT_10_BOLD)
+        text.add_tag("note", font=self.FONT_8, foreground=colors.secondary,
+                     lmargin1=PAD * 3, lmargin2=PAD * 3)
+        text.add_tag("synergy", font=self.FONT_10_BOLD, foreground="#E3B341")
+        text.add_tag("strengths", font=self.FONT_11_BOLD,
+                     foreground=colors.success)
+        text.add_tag("weaknesses", font=self.FONT_11_BOLD,
+                     foreground=colors.danger, spacing1=PAD)
+        text.add_tag("strength", foreground="#3FB950", lmargin2=PAD * 2)
+        text.add_tag("weakness", foreground="#F85149", lmargin2=PAD * 2)
+        text.add_tag("improvement", foreground="#D29922", lmargin2=PAD * 3)
+        text.pack(fill="x", padx=PAD)
+        return text
+
+    def clear(self):
+        for section in self._sections:
+            section.pack_forget()
+        self._bottom_pad.pack_forget()
+        self._scrollbar.pack_forget()
+        self._canvas.pack_forget()
+
+    def show_build(self, build: dict, char_name: str, loader, analyzer):
+        """Populate the panel with a build's full details."""
+        shown = [self._header]
+
         # Header
         name = build.get("name", "Unknown")
         if build.get("_custom"):
-            ttk.Label(f, text="CUSTOM BUILD",
-                      font=("Segoe UI", 9, "bold"),
-                      foreground=CUSTOM_BUILD_COLOR).pack(
-                anchor="w", padx=PAD, pady=(PAD, 0))
-        ttk.Label(f, text=name, font=("Segoe UI", 16, "bold"),
-                  bootstyle="light").pack(anchor="w", padx=PAD,
-                                          pady=(PAD if not build.get("_custom") else 0, 0))
-        ttk.Label(f, text=f"Character: {char_name.capitalize()}",
-                  font=("Segoe UI", 11), bootstyle="secondary").pack(
-            anchor="w", padx=PAD)
+            self._custom_lbl.pack(anchor="w", padx=PAD, pady=(PAD, 0),
+                                  before=self._name_lbl)
+            self._name_lbl.pack_configure(pady=(0, 0))
+        else:
+            self._custom_lbl.pack_forget()
+            self._name_lbl.pack_configure(pady=(PAD, 0))
+        self._name_lbl.configure(text=name)
+        self._char_lbl.configure(text=f"Character: {char_name.capitalize()}")
 
         # Score
         scorecard = analyzer.build_scorecard(char_name, name)
@@ -73,119 +221,81 @@ class BuildDetailPanel(ttk.Frame):
             grade = scorecard["grade"]
             grade_color = GRADE_COLORS.get(grade, "#8B949E")
 
-            sf = ttk.Frame(f)
-            sf.pack(anchor="w", padx=PAD, pady=(PAD, 0))
-            ttk.Label(sf, text=f"Grade: ", font=("Segoe UI", 12)).pack(side="left")
-            ttk.Label(sf, text=grade, font=("Segoe UI", 14, "bold"),
-                      foreground=grade_color).pack(side="left")
-            ttk.Label(sf, text=f"  Score: {score_val}/100",
-                      font=("Segoe UI", 12)).pack(side="left")
-
-            bar = ScoreBar(f, score=score_val, width=200, height=18)
-            bar.pack(anchor="w", padx=PAD, pady=PAD_SM)
+            self._grade_lbl.configure(text=grade, foreground=grade_color)
+            self._score_lbl.configure(text=f"  Score: {score_val}/100")
+            self._score_bar.set_score(score_val)
 
-            # Breakdown
             sc = scorecard["score"]
-            for label, val, mx in [
-                ("Synergy", sc["synergy"], 40),
-                ("Rarity", sc["rarity"], 20),
-                ("Validity", sc["validity"], 20),
-                ("Completeness", sc["completeness"], 20),
-            ]:
-                row = ttk.Frame(f)
-                row.pack(anchor="w", padx=PAD * 2, fill="x")
-                ttk.Label(row, text=f"{label}:", width=14,
-                          font=("Segoe UI", 9)).pack(side="left")
-                mini = ScoreBar(row, score=int(val * 100 / mx), width=100, height=12)
-                mini.pack(side="left", padx=PAD_SM)
-                ttk.Label(row, text=f"{val}/{mx}",
-                          font=("Segoe UI", 9)).pack(side="left")
+            for key, mx, mini, val_lbl in self._breakdown:
+                val = sc[key]
+                mini.set_score(int(val * 100 / mx))
+                val_lbl.configure(text=f"{val}/{mx}")
+            shown.append(self._score_section)
 
         # Concept & Playstyle
-        ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD)
-        ttk.Label(f, text="Concept", font=("Segoe UI", 11, "bold"),
-                  bootstyle="info").pack(anchor="w", padx=PAD)
-        ttk.Label(f, text=build.get("concept", "N/A"), wraplength=400,
-                  font=("Segoe UI", 10)).pack(anchor="w", padx=PAD * 2, pady=PAD_SM)
-
-        ttk.Label(f, text="Playstyle", font=("Segoe UI", 11, "bold"),
-                  bootstyle="info").pack(anchor="w", padx=PAD)
-        ttk.Label(f, text=build.get("playstyle", "N/A"), wraplength=400,
-                  font=("Segoe UI", 10)).pack(anchor="w", padx=PAD * 2, pady=PAD_SM)
+        self._concept_lbl.configure(text=build.get("concept", "N/A"))
+        self._playstyle_lbl.configure(text=build.get("playstyle", "N/A"))
+        shown.append(self._concept_section)
 
         # Memories & Essences
-        ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD)
         memories = build.get("memories", [])
-        ttk.Label(f, text=f"Memories ({len(memories)})",
-                  font=("Segoe UI", 11, "bold"), bootstyle="info").pack(
-            anchor="w", padx=PAD)
-
+        self._memories_lbl.configure(text=f"Memories ({len(memories)})")
+        rarity_map = loader.essence_rarity_map
+        lines = []
         for i, mem in enumerate(memories, 1):
-            ttk.Label(f, text=f"  {i}. {mem.get('name', '?')}",
-                      font=("Segoe UI", 10, "bold")).pack(anchor="w", padx=PAD)
+            lines.append((f"  {i}. {mem.get('name', '?')}", "memory"))
             for ess in mem.get("essences", []):
-                rarity = loader.essence_rarity_map.get(ess, "Unknown")
-                color = RARITY_COLORS.get(rarity, "#8B949E")
-                ttk.Label(f, text=f"      [{rarity[0]}] {ess}",
-                          font=("Segoe UI", 9), foreground=color).pack(
-                    anchor="w", padx=PAD)
+                rarity = rarity_map.get(ess, "Unknown")
+                lines.append((f"      [{rarity[0]}] {ess}", rarity))
             if mem.get("rationale"):
-                ttk.Label(f, text=f"      {mem['rationale']}",
-                          font=("Segoe UI", 8), bootstyle="secondary",
-                          wraplength=380).pack(anchor="w", padx=PAD * 2)
+                lines.append((mem["rationale"], "note"))
+        self._memories_text.set_lines(lines)
+        shown.append(self._memories_section)
 
         # Synergies
         if scorecard and scorecard["score"]["synergy_details"]:
-            ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD)
-            ttk.Label(f, text="Active Synergies",
-                      font=("Segoe UI", 11, "bold"), bootstyle="success").pack(
-                anchor="w", padx=PAD)
+            lines = []
             for s in scorecard["score"]["synergy_details"]:
                 pair_str = " + ".join(s["pair"])
-                ttk.Label(f, text=f"  [{s['score']}pts] {pair_str}",
-                          font=("Segoe UI", 10, "bold"),
-                          foreground="#E3B341").pack(anchor="w", padx=PAD)
+                lines.append((f"  [{s['score']}pts] {pair_str}", "synergy"))
                 if s.get("description"):
-                    ttk.Label(f, text=f"    {s['description']}",
-                              font=("Segoe UI", 8), bootstyle="secondary",
-                              wraplength=380).pack(anchor="w", padx=PAD * 2)
+                    lines.append((s["description"], "note"))
+            self._synergy_text.set_lines(lines)
+            shown.append(self._synergy_section)
 
         # Strengths & Weaknesses
-        ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD)
+        lines = []
         strengths = build.get("strengths", [])
         if strengths:
-            ttk.Label(f, text="Strengths", font=("Segoe UI", 11, "bold"),
-                      bootstyle="success").pack(anchor="w", padx=PAD)
-            for s in strengths[:5]:
-                ttk.Label(f, text=f"  + {s}", font=("Segoe UI", 9),
-                          foreground="#3FB950").pack(anchor="w", padx=PAD)
+            lines.append(("Strengths", "strengths"))
+            lines.extend((f"  + {s}", "strength") for s in strengths[:5])
 
         weaknesses = build.get("weaknesses", [])
         if weaknesses:
-            ttk.Label(f, text="Weaknesses", font=("Segoe UI", 11, "bold"),
-                      bootstyle="danger").pack(anchor="w", padx=PAD, pady=(PAD, 0))
-            for w in weaknesses[:4]:
-                ttk.Label(f, text=f"  - {w}", font=("Segoe UI", 9),
-                          foreground="#F85149").pack(anchor="w", padx=PAD)
+            lines.append(("Weaknesses", "weaknesses"))
+            lines.extend((f"  - {w}", "weakness") for w in weaknesses[:4])
+        self._traits_text.set_lines(lines)
+        shown.append(self._traits_section)
 
         # Strategy
         strategy = build.get("strategy", "")
         if strategy:
-            ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD)
-            ttk.Label(f, text="Strategy", font=("Segoe UI", 11, "bold"),
-                      bootstyle="info").pack(anchor="w", padx=PAD)
-            ttk.Label(f, text=strategy, wraplength=400,
-                      font=("Segoe UI", 9)).pack(anchor="w", padx=PAD * 2, pady=PAD_SM)
+            self._strategy_lbl.configure(text=strategy)
+            shown.append(self._strategy_section)
 
         # Improvements
         if scorecard and scorecard.get("improvements"):
-            ttk.Separator(f).pack(fill="x", padx=PAD, pady=PAD)
-            ttk.Label(f, text="Suggested Improvements",
-                      font=("Segoe UI", 11, "bold"), bootstyle="warning").pack(
-                anchor="w", padx=PAD)
-            for imp in scorecard["improvements"]:
-                ttk.Label(f, text=f"  -> {imp}", font=("Segoe UI", 9),
-                          foreground="#D29922").pack(anchor="w", padx=PAD)
+            self._improvements_text.set_lines([
+                (f"  -> {imp}", "improvement")
+                for imp in scorecard["improvements"]
+            ])
+            shown.append(self._improvements_section)
 
-        # Bottom padding
-        ttk.Label(f, text="").pack(pady=PAD_SM)
+        # Re-pack only the sections this build needs, in order
+        self.clear()
+        self._scrollbar.pack(side="right", fill="y")
+        self._canvas.pack(side="left", fill="both", expand=True)
+        for section in shown:
+            section.pack(fill="x", anchor="w")
+        self._bottom_pad.pack(pady=PAD_SM)
+        self._canvas.yview_moveto(0)
@@ -0,0 +1,60 @@
+"""Read-only multi-line list with rarity-colored lines."""
+
+import tkinter as tk
+import ttkbootstrap as ttk
+from gui.theme import RARITY_COLORS
+
+
+class DetailList(tk.Text):
+    """Disabled Text widget showing one line per item, tagged by rarity.
+
+    Replaces a column of per-item labels with a single widget. Extra line
+    styles can be registered with add_tag; with wrap enabled the height
+    follows the number of display lines.
+    """
+
+    def __init__(self, parent, font=("Segoe UI", 9), wrap="none", **kwargs):
+        colors = ttk.Style().colors
+        super().__init__(parent, height=1, wrap=wrap, font=font,
+                         bg=colors.bg, fg=colors.fg,
+                         borderwidth=0, highlightthickness=0,
+                         relief="flat", cursor="arrow", **kwargs)
+        self._tags = set(RARITY_COLORS)
+        for rarity, color in RARITY_COLORS.items():
+            self.tag_configure(rarity, foreground=color)
+        self.configure(state="disabled")
+        self._wraps = wrap != "none"
+        if self._wraps:
+            # Wrapped line count depends on the width, known once laid out
+            self.bind("<Configure>", self._fit_height, add="+")
+
+    def add_tag(self, name, **options):
+        """Register a line style (font, foreground, margins...) for set_lines."""
+        self.tag_configure(name, **options)
+        self._tags.add(name)
+
+    def set_lines(self, lines):
+        """Replace the contents with *lines*: (text, rarity or tag or None) pairs."""
+        self.configure(state="normal")
+        self.delete("1.0", "end")
+        for i, (text, rarity) in enumerate(lines):
+            prefix = "\n" if i else ""
+            if rarity is None:
+                self.insert("end", prefix + text)
+            else:
+                # Unrecognised rarities fall back to the Common grey
+                tag = rarity if rarity in self._tags else "Common"
+                self.insert("end", prefix + text, tag)
+        self.configure(state="disabled")
+        if self._wraps:
+            self._fit_height()
+        else:
+            self.configure(height=max(1, len(lines)))
+
+    def _fit_height(self, _event=None):
+        count = self.count("1.0", "end", "update", "displaylines")
+        if isinstance(count, tuple):
+            count = count[0]
+        height = max(1, count or 0)
+        if int(self.cget("height")) != height:
+            self.configure(height=height)
@@ -8,14 +8,21 @@ class MemorySlotWidget(ttk.Frame):
     """A single memory slot: memory dropdown, 3 essence dropdowns, rationale."""
 
     def __init__(self, parent, slot_number, memory_names, essence_names,
-                 rarity_map, on_change=None, on_remove=None, **kwargs):
+                 rarity_map, on_change=None, on_remove=None, slot_list=None,
+                 **kwargs):
         super().__init__(parent, **kwargs)
-        self.slot_number = slot_number
+        self._slot_number = slot_number
+        self._slot_list = slot_list  # Owner's slot list; numbers derive from it
+        # Shared with the other slots; never mutated here
         self._memory_names = memory_names
         self._essence_names = essence_names
         self._rarity_map = rarity_map
         self._on_change = on_change
         self._on_remove = on_remove
+        self._essences_fs = frozenset()  # Refreshed on essence selection
+        # Last handled selections; re-picking the same value is a no-op
+        self._last_mem = ""
+        self._last_ess = [""] * 3
 
         self._setup_ui()
 
@@ -31,7 +38,7 @@ class MemorySlotWidget(ttk.Frame):
         if self._on_remove:
             ttk.Button(header, text="X", width=3,
                        bootstyle="danger-outline",
-                       command=self._on_remove).pack(side="right")
+                       command=lambda: self._on_remove(self)).pack(side="right")
 
         # Memory dropdown
         mem_row = ttk.Frame(self)
@@ -43,7 +50,7 @@ class MemorySlotWidget(ttk.Frame):
                                        values=self._memory_names,
                                        state="readonly", width=30)
         self._mem_combo.pack(side="left", padx=PAD_SM)
-        self._mem_combo.bind("<<ComboboxSelected>>", self._notify_change)
+        self._mem_combo.bind("<<ComboboxSelected>>", self._on_memory_selected)
 
         # Essence dropdowns (3 slots)
         self._ess_vars = []
@@ -85,12 +92,23 @@ class MemorySlotWidget(ttk.Frame):
         # Separator
         ttk.Separator(self).pack(fill="x", padx=PAD_SM, pady=(0, PAD_SM))
 
+    def _on_memory_selected(self, _event=None):
+        name = self._mem_var.get()
+        if name == self._last_mem:
+            return
+        self._last_mem = name
+        self._notify_change()
+
     def _on_essence_selected(self, idx):
         """Update rarity label when an essence is selected."""
         name = self._ess_vars[idx].get()
+        if name == self._last_ess[idx]:
+            return
+        self._last_ess[idx] = name
         rarity = self._rarity_map.get(name, "Unknown")
         color = RARITY_COLORS.get(rarity, RARITY_COLORS["Unknown"])
         self._ess_labels[idx].configure(text=f"[{rarity}]", foreground=color)
+        self._essences_fs = frozenset(self.essences)
         self._notify_change()
 
     def _notify_change(self, _event=None):
@@ -99,6 +117,19 @@ class MemorySlotWidget(ttk.Frame):
 
     # ── Public API ───────────────────────────────────────────────────
 
+    def update_essence_values(self, essence_names):
+        """Point the essence dropdowns at a new (shared) names sequence."""
+        self._essence_names = essence_names
+        for combo in self._ess_combos:
+            combo.configure(values=essence_names)
+
+    @property
+    def slot_number(self) -> int:
+        """1-based position, derived from the owner's list when available."""
+        if self._slot_list is not None and self in self._slot_list:
+            return self._slot_list.index(self) + 1
+        return self._slot_number
+
     @property
     def memory_name(self) -> str:
         return self._mem_var.get()
@@ -107,6 +138,11 @@ class MemorySlotWidget(ttk.Frame):
     def essences(self) -> list:
         return [v.get() for v in self._ess_vars if v.get()]
 
+    @property
+    def essences_frozenset(self) -> frozenset:
+        """Selected essences, cached between combobox changes."""
+        return self._essences_fs
+
     @property
     def rationale(self) -> str:
         return self._rationale_var.get().strip()
@@ -115,6 +151,7 @@ class MemorySlotWidget(ttk.Frame):
                    rationale: str = ""):
         """Populate from an existing build's memory entry."""
         self._mem_var.set(memory_name)
+        self._last_mem = memory_name
         for i, ess in enumerate(essences[:3]):
             self._ess_vars[i].set(ess)
             self._on_essence_selected(i)
@@ -123,9 +160,12 @@ class MemorySlotWidget(ttk.Frame):
     def clear(self):
         """Reset all fields."""
         self._mem_var.set("")
+        self._last_mem = ""
         for i in range(3):
             self._ess_vars[i].set("")
             self._ess_labels[i].configure(text="")
+        self._last_ess = [""] * 3
+        self._essences_fs = frozenset()
         self._rationale_var.set("")
 
     def to_dict(self) -> dict:
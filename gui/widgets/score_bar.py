@@ -12,22 +12,27 @@ class ScoreBar(tk.Canvas):
                          highlightthickness=0, **kwargs)
         self._width = width
         self._height = height
+        # Items are created once; set_score only reconfigures them
+        self._bg_id = self.create_rectangle(0, 0, width, height,
+                                            fill="#21262D", outline="#30363D")
+        self._fill_id = self.create_rectangle(0, 0, 0, height,
+                                              fill="", outline="",
+                                              state="hidden")
+        self._text_id = self.create_text(width // 2, height // 2,
+                                         fill="#E6EDF3",
+                                         font=("Segoe UI", 8, "bold"))
         self.set_score(score)
 
     def set_score(self, score: int):
-        self.delete("all")
         score = max(0, min(100, score))
 
-        # Background
-        self.create_rectangle(0, 0, self._width, self._height,
-                              fill="#21262D", outline="#30363D")
         # Filled portion
         fill_w = int(self._width * score / 100)
         if fill_w > 0:
-            color = score_color(score)
-            self.create_rectangle(0, 0, fill_w, self._height,
-                                  fill=color, outline="")
+            self.coords(self._fill_id, 0, 0, fill_w, self._height)
+            self.itemconfigure(self._fill_id, fill=score_color(score),
+                               state="normal")
+        else:
+            self.itemconfigure(self._fill_id, state="hidden")
         # Score text
-        self.create_text(self._width // 2, self._height // 2,
-                         text=str(score), fill="#E6EDF3",
-                         font=("Segoe UI", 8, "bold"))
+        self.itemconfigure(self._text_id, text=str(score))
@@ -4,11 +4,15 @@ import ttkbootstrap as ttk
 
 
 class SearchBar(ttk.Frame):
-    """Search entry with clear button. Calls on_change(query) on keypress."""
+    """Search entry with clear button. Calls on_change(query) once typing
+    pauses for *delay* ms (0 = on every keypress)."""
 
-    def __init__(self, parent, placeholder: str = "Search...", on_change=None, **kwargs):
+    def __init__(self, parent, placeholder: str = "Search...", on_change=None,
+                 delay: int = 75, **kwargs):
         super().__init__(parent, **kwargs)
         self._on_change = on_change
+        self._delay = delay
+        self._pending = None  # after() id of the debounced on_change
 
         self._var = ttk.StringVar()
         self._var.trace_add("write", self._notify)
@@ -30,6 +34,11 @@ class SearchBar(ttk.Frame):
 
     def _show_placeholder(self):
         if not self._var.get():
+            if self._pending:
+                # Deliver the pending (empty) query now: once the placeholder
+                # is in the entry the timer would no longer see an empty field
+                self._cancel_pending()
+                self._on_change("")
             self._is_placeholder = True
             self._entry.configure(foreground="#484F58")
             self._entry.delete(0, "end")
@@ -46,11 +55,27 @@ class SearchBar(ttk.Frame):
             self._show_placeholder()
 
     def _notify(self, *_args):
-        if self._on_change and not getattr(self, "_is_placeholder", False):
+        if self._on_change is None or getattr(self, "_is_placeholder", False):
+            return
+        if not self._delay:
             self._on_change(self._var.get())
+            return
+        if self._pending:
+            self.after_cancel(self._pending)
+        self._pending = self.after(self._delay, self._fire)
+
+    def _fire(self):
+        self._pending = None
+        self._on_change(self.query)
+
+    def _cancel_pending(self):
+        if self._pending:
+            self.after_cancel(self._pending)
+            self._pending = None
 
     def clear(self):
         self._entry.delete(0, "end")
+        self._cancel_pending()
         self._is_placeholder = False
         if self._on_change:
             self._on_change("")
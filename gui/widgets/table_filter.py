@@ -0,0 +1,57 @@
+"""Row filtering for a ttkbootstrap Tableview without rebuilding it."""
+
+
+class TableFilter:
+    """Shows a subset of a Tableview's rows by detaching/reattaching items.
+
+    Rows are inserted once; set_filter only diffs the treeview against the
+    rows that should be visible, in the table's current (sorted) order.
+
+    ttkbootstrap's Tableview sorts on <Button-1> over a heading
+    (Tableview._header_leftclick -> sort_column_data), which reloads the
+    treeview and reattaches every row, filtered or not. Its handler runs
+    before anything we could bind to the same event, so the filter is
+    re-applied on <ButtonRelease-1> over a heading via *on_resort*.
+    """
+
+    def __init__(self, table, on_resort):
+        self._table = table
+        self._on_resort = on_resort
+        self._key = None  # filter key currently shown
+        table.view.bind("<ButtonRelease-1>", self._on_release, add="+")
+
+    def set_filter(self, key, predicate=None):
+        """Show rows whose iid passes *predicate* (all rows if None).
+
+        Skipped when *key* equals the filter already shown.
+        """
+        if key == self._key:
+            return
+        self._key = key
+        rows = self._table.tablerows
+        if predicate is None:
+            visible = [row.iid for row in rows]
+        else:
+            visible = [row.iid for row in rows if predicate(row.iid)]
+        self._apply(visible)
+
+    def reset(self):
+        """Forget the shown filter, e.g. after the rows were reloaded."""
+        self._key = None
+
+    def _apply(self, visible):
+        view = self._table.view
+        shown = set(view.get_children())
+        keep = set(visible)
+        hidden = [iid for iid in shown if iid not in keep]
+        if hidden:
+            view.detach(*hidden)
+        for index, iid in enumerate(visible):
+            if iid not in shown:
+                view.reattach(iid, "", index)
+
+    def _on_release(self, event):
+        if self._table.view.identify_region(event.x, event.y) == "heading":
+            # The sort reattached every row, so the shown set is stale
+            self._key = None
+            self._on_resort()
@@ -0,0 +1,12 @@
+"""Objects shared across test modules (built once per test run)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analysis.data_loader import DataLoader
+
+# Read-only loader over the real project data; tests that need to write
+# (custom builds) use their own loader on a temp directory
+LOADER = DataLoader()
@@ -6,16 +6,22 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from analysis.data_loader import DataLoader
+from tests._shared import LOADER
 from analysis.build_comparator import BuildComparator
 from analysis.synergy_analyzer import SynergyAnalyzer
 from analysis.build_analyzer import BuildAnalyzer
 
+# Memory configs shared by tests; essences are tuples so nothing can mutate them
+_CROSS_MEM_SAMPLE = (
+    {"name": "M1", "essences": ("Essence of Paranoia",)},
+    {"name": "M2", "essences": ("Essence of Momentum",)},
+)
+
 
 class TestBuildComparator(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.loader = DataLoader()
+        cls.loader = LOADER
         cls.comparator = BuildComparator(cls.loader)
 
     def test_compare_known_character(self):
@@ -68,7 +74,7 @@ class TestBuildComparator(unittest.TestCase):
 class TestSynergyAnalyzer(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.loader = DataLoader()
+        cls.loader = LOADER
         cls.analyzer = SynergyAnalyzer(cls.loader)
 
     def test_find_synergies_known_memory(self):
@@ -86,11 +92,8 @@ class TestSynergyAnalyzer(unittest.TestCase):
         self.assertIn("error", result)
 
     def test_cross_memory_synergies(self):
-        memories = [
-            {"name": "M1", "essences": ["Essence of Paranoia"]},
-            {"name": "M2", "essences": ["Essence of Momentum"]},
-        ]
-        result = self.analyzer.analyze_cross_memory_synergies(memories)
+        result = self.analyzer.analyze_cross_memory_synergies(
+            list(_CROSS_MEM_SAMPLE))
         self.assertIn("cross_memory_synergies", result)
         self.assertGreater(result["cross_memory_score"], 0)
 
@@ -110,7 +113,7 @@ class TestSynergyAnalyzer(unittest.TestCase):
 class TestBuildAnalyzer(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.loader = DataLoader()
+        cls.loader = LOADER
         cls.analyzer = BuildAnalyzer(cls.loader)
 
     def test_unified_score(self):
@@ -158,6 +161,18 @@ class TestBuildAnalyzer(unittest.TestCase):
         self.assertIn("unused_essences", report)
         self.assertIn("most_common_pairs", report)
         self.assertGreater(report["total_builds"], 0)
+        for item in report["most_common_pairs"]:
+            self.assertEqual(item["display"].count("  +  "), 1)
+            for name in item["pair"]:
+                self.assertIn(name, item["display"])
+
+    def test_essence_meta_report_split(self):
+        report = self.analyzer.essence_meta_report()
+        basic = self.analyzer.essence_meta_report_basic()
+        self.assertNotIn("most_common_pairs", basic)
+        self.assertEqual(basic["most_used"], report["most_used"])
+        self.assertEqual(self.analyzer.essence_meta_report_pairs(),
+                         report["most_common_pairs"])
 
     def test_build_scorecard(self):
         card = self.analyzer.build_scorecard("mist", "Twilight")
@@ -1,6 +1,7 @@
 """Tests for custom build save/load/delete functionality."""
 
 import json
+import os
 import shutil
 import tempfile
 import unittest
@@ -8,20 +9,21 @@ from pathlib import Path
 
 from analysis.data_loader import DataLoader
 
+REAL_DATA_DIR = Path(__file__).parent.parent / "data"
+
 
 class TestCustomBuilds(unittest.TestCase):
     """Test custom build persistence via DataLoader."""
 
-    def setUp(self):
-        """Create a temp directory mimicking the project layout."""
-        self.test_dir = Path(tempfile.mkdtemp())
-
-        # Copy real data/ directory for valid essences/memories
-        real_data = Path(__file__).parent.parent / "data"
-        shutil.copytree(real_data, self.test_dir / "data")
+    @classmethod
+    def setUpClass(cls):
+        """Create one temp directory mimicking the project layout."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._tmp.cleanup)
+        cls.test_dir = Path(cls._tmp.name)
 
-        # Create minimal builds/ with one bundled build
-        builds_dir = self.test_dir / "builds"
+        # Create minimal builds/ with one bundled build (never written to)
+        builds_dir = cls.test_dir / "builds"
         builds_dir.mkdir()
         bundled = {
             "character": "Mist",
@@ -38,13 +40,16 @@ class TestCustomBuilds(unittest.TestCase):
         with open(builds_dir / "mist_builds.json", "w", encoding="utf-8") as f:
             json.dump(bundled, f)
 
+    def setUp(self):
         # Loader with test dir
         self.loader = DataLoader(base_dir=self.test_dir)
-        # Point custom builds to test dir too
+        # Essences/memories are only read, so use the real data/ in place
+        self.loader.data_dir = REAL_DATA_DIR
+        # Only custom_builds/ is written; each test starts without one
         self.loader.custom_builds_dir = self.test_dir / "custom_builds"
 
     def tearDown(self):
-        shutil.rmtree(self.test_dir)
+        shutil.rmtree(self.loader.custom_builds_dir, ignore_errors=True)
 
     def _sample_build(self, name="My Custom Build"):
         return {
@@ -93,6 +98,19 @@ class TestCustomBuilds(unittest.TestCase):
         self.assertIn("Test Bundled Build", names)
         self.assertIn("My Custom Build", names)
 
+    def test_all_builds_refreshes_after_save_and_delete(self):
+        """The cached merge is rebuilt when custom builds change."""
+        before = [b["name"] for b in self.loader.all_builds.get("mist", [])]
+        self.assertNotIn("My Custom Build", before)
+
+        self.loader.save_custom_build("mist", self._sample_build())
+        names = [b["name"] for b in self.loader.all_builds["mist"]]
+        self.assertIn("My Custom Build", names)
+
+        self.loader.delete_custom_build("mist", "My Custom Build")
+        names = [b["name"] for b in self.loader.all_builds["mist"]]
+        self.assertNotIn("My Custom Build", names)
+
     def test_save_replaces_existing_by_name(self):
         """Saving a build with same name overwrites the previous one."""
         build = self._sample_build()
@@ -106,6 +124,16 @@ class TestCustomBuilds(unittest.TestCase):
         self.assertEqual(len(custom["mist"]), 1)
         self.assertEqual(custom["mist"][0]["concept"], "Updated concept")
 
+    def test_identical_save_skips_write(self):
+        """Re-saving an unchanged build leaves the file untouched."""
+        path = self.loader.save_custom_build("mist", self._sample_build())
+        # Backdate the file so any rewrite would show up as a new mtime
+        os.utime(path, ns=(0, 0))
+
+        self.loader.save_custom_build("mist", self._sample_build())
+        self.assertEqual(path.stat().st_mtime_ns, 0)
+        self.assertEqual(list(path.parent.glob("*.tmp")), [])
+
     def test_save_multiple_builds_same_character(self):
         """Multiple custom builds for the same character coexist."""
         self.loader.save_custom_build("mist", self._sample_build("Build A"))
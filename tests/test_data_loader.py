@@ -1,13 +1,16 @@
 """Tests for the DataLoader module."""
 
+import json
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
 # Ensure project root is on path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from analysis.data_loader import DataLoader, DataLoadError
+from analysis.data_loader import DataLoader, DataLoadError, write_json
+from tests._shared import LOADER
 
 
 class TestDataLoader(unittest.TestCase):
@@ -15,7 +18,7 @@ class TestDataLoader(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.loader = DataLoader()
+        cls.loader = LOADER
 
     def test_loads_builds(self):
         builds = self.loader.builds
@@ -74,6 +77,24 @@ class TestDataLoader(unittest.TestCase):
         self.assertIn("Essence of Paranoia", rmap)
         self.assertEqual(rmap["Essence of Paranoia"], "Legendary")
 
+    def test_essences_by_synergy_type(self):
+        index = self.loader.essences_by_synergy_type
+        self.assertGreater(len(index), 0)
+        for synergy_type, essences in index.items():
+            for ess in essences:
+                self.assertIn(synergy_type, ess.get("synergy_types", []))
+        order = {e["name"]: i for i, e in enumerate(self.loader.essences)}
+        for essences in index.values():
+            positions = [order[e["name"]] for e in essences]
+            self.assertEqual(positions, sorted(positions))
+
+    def test_essence_types_map(self):
+        tmap = self.loader.essence_types_map
+        ess = self.loader.essence_by_name["Essence of Paranoia"]
+        self.assertIsInstance(tmap["Essence of Paranoia"], frozenset)
+        self.assertEqual(tmap["Essence of Paranoia"],
+                         frozenset(ess.get("synergy_types", [])))
+
     def test_memory_by_name_lookup(self):
         lookup = self.loader.memory_by_name
         self.assertIsInstance(lookup, dict)
@@ -104,12 +125,18 @@ class TestDataLoader(unittest.TestCase):
             total = sum(rarity.values())
             self.assertGreater(total, 0)
 
-    def test_invalidate_cache(self):
-        # Should not crash
-        self.loader.invalidate_cache()
-        # Data should reload on next access
-        builds = self.loader.builds
-        self.assertGreater(len(builds), 0)
+    def test_essence_usage_counts(self):
+        counts = self.loader.essence_usage_counts
+        self.assertGreater(counts.get("Essence of Paranoia", 0), 0)
+        self.assertNotIn("Nonexistent Essence", counts)
+        # Missing names count as zero without being inserted
+        self.assertEqual(counts["Nonexistent Essence"], 0)
+        self.assertNotIn("Nonexistent Essence", counts)
+
+    def test_memory_usage_counts(self):
+        counts = self.loader.memory_usage_counts
+        self.assertIsInstance(counts, dict)
+        self.assertGreater(sum(counts.values()), 0)
 
     def test_missing_file_raises_error(self):
         bad_loader = DataLoader(base_dir=Path("/nonexistent"))
@@ -117,5 +144,31 @@ class TestDataLoader(unittest.TestCase):
             _ = bad_loader.essences
 
 
+class TestDataLoaderInvalidate(unittest.TestCase):
+    """Cache invalidation, on a private loader so the shared one stays warm."""
+
+    def test_invalidate_cache(self):
+        loader = DataLoader()
+        self.assertGreater(len(loader.builds), 0)
+        # Should not crash
+        loader.invalidate_cache()
+        self.assertIsNone(loader._builds)
+        # Data should reload on next access
+        builds = loader.builds
+        self.assertGreater(len(builds), 0)
+
+
+class TestWriteJson(unittest.TestCase):
+    def test_round_trip_without_leftover_tmp(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "index.json"
+            data = {"name": "Flèche", "items": [1, 2]}
+            write_json(path, data)
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), data)
+            # Non-ASCII is written raw, not as \u escapes
+            self.assertIn("Flèche", path.read_text(encoding="utf-8"))
+            self.assertEqual([p.name for p in Path(tmp).iterdir()], ["index.json"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,7 +12,12 @@ from analysis.synergies import (
     score_essence_set,
     find_all_synergies_in_set,
     get_category_for_types,
+    sorted_pairs_rows,
     ESSENCE_SYNERGIES,
+    ESSENCE_SYNERGY_AVG,
+    ESSENCE_SYNERGY_MAX,
+    ESSENCE_SYNERGY_TOTAL,
+    SOLO_ESSENCE_SCORES,
     SYNERGY_CATEGORIES,
 )
 
@@ -83,6 +88,13 @@ class TestFindAllSynergiesInSet(unittest.TestCase):
         found = find_all_synergies_in_set(set())
         self.assertEqual(found, [])
 
+    def test_cached_results_are_not_shared(self):
+        essences = {"Essence of Paranoia", "Essence of Momentum"}
+        first = find_all_synergies_in_set(essences)
+        first[0]["pair"].append("mutated")
+        second = find_all_synergies_in_set(frozenset(essences))
+        self.assertNotIn("mutated", second[0]["pair"])
+
 
 class TestGetCategoryForTypes(unittest.TestCase):
     def test_single_match(self):
@@ -100,14 +112,11 @@ class TestGetCategoryForTypes(unittest.TestCase):
 
 
 class TestSynergyDefinitionsIntegrity(unittest.TestCase):
-    def test_all_pairs_have_score(self):
+    def test_pair_entries_valid(self):
         for pair, info in ESSENCE_SYNERGIES.items():
             self.assertIn("score", info, f"Missing score for pair {pair}")
             self.assertIsInstance(info["score"], int)
             self.assertGreater(info["score"], 0)
-
-    def test_all_pairs_have_description(self):
-        for pair, info in ESSENCE_SYNERGIES.items():
             self.assertIn("description", info, f"Missing description for pair {pair}")
             self.assertIsInstance(info["description"], str)
             self.assertGreater(len(info["description"]), 0)
@@ -117,6 +126,20 @@ class TestSynergyDefinitionsIntegrity(unittest.TestCase):
             self.assertIsInstance(types, list)
             self.assertGreater(len(types), 0)
 
+    def test_sorted_pairs_rows(self):
+        rows = sorted_pairs_rows()
+        self.assertEqual(len(rows), ESSENCE_SYNERGY_TOTAL)
+        scores = [r[2] for r in rows]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertIs(sorted_pairs_rows(), rows)
+
+    def test_summary_stats(self):
+        scores = [info["score"] for info in ESSENCE_SYNERGIES.values()]
+        self.assertEqual(ESSENCE_SYNERGY_MAX, max(scores))
+        self.assertEqual(ESSENCE_SYNERGY_AVG, sum(scores) // len(scores))
+        self.assertEqual(ESSENCE_SYNERGY_TOTAL,
+                         len(ESSENCE_SYNERGIES) + len(SOLO_ESSENCE_SCORES))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,7 +6,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from analysis.data_loader import DataLoader
+from tests._shared import LOADER
 from analysis.validators import (
     validate_no_duplicate_essences,
     validate_build_references,
@@ -14,15 +14,29 @@ from analysis.validators import (
     validate_full_build,
 )
 
+# Schema-complete build shared by tests; variants are built with dict()
+# copies, never by mutating this one
+_VALID_BUILD = {
+    "name": "Test Build",
+    "concept": "Test concept",
+    "playstyle": "Test",
+    "memories": [{"name": "Mem1", "essences": ["Ess1", "Ess2"]}],
+    "constellation_tree": {"primary": "Destruction"},
+    "strengths": ["Strong"],
+    "weaknesses": ["Weak"],
+}
+
+_MIST_BUILDS = LOADER.builds_for("mist")
+
+# Read-only memories shared by the duplicate-essence tests
+_MEM_A = {"name": "A", "essences": ("Ess1", "Ess2")}
+_MEM_B = {"name": "B", "essences": ("Ess3", "Ess4")}
+_MEM_B_DUP = {"name": "B", "essences": ("Ess1", "Ess3")}
+
 
 class TestValidateNoDuplicateEssences(unittest.TestCase):
     def test_valid_build_no_duplicates(self):
-        build = {
-            "memories": [
-                {"name": "A", "essences": ["Ess1", "Ess2"]},
-                {"name": "B", "essences": ["Ess3", "Ess4"]},
-            ]
-        }
+        build = {"memories": (_MEM_A, _MEM_B)}
         result = validate_no_duplicate_essences(build)
         self.assertTrue(result["valid"])
         self.assertEqual(result["duplicates"], [])
@@ -30,12 +44,7 @@ class TestValidateNoDuplicateEssences(unittest.TestCase):
         self.assertEqual(result["unique_essences"], 4)
 
     def test_invalid_build_with_duplicates(self):
-        build = {
-            "memories": [
-                {"name": "A", "essences": ["Ess1", "Ess2"]},
-                {"name": "B", "essences": ["Ess1", "Ess3"]},
-            ]
-        }
+        build = {"memories": (_MEM_A, _MEM_B_DUP)}
         result = validate_no_duplicate_essences(build)
         self.assertFalse(result["valid"])
         self.assertEqual(result["duplicates"], ["Ess1"])
@@ -59,63 +68,39 @@ class TestValidateNoDuplicateEssences(unittest.TestCase):
         self.assertIn("Ess1", result["duplicates"])
 
 
-class TestValidateBuildSchema(unittest.TestCase):
-    def test_valid_build(self):
-        build = {
-            "name": "Test Build",
-            "concept": "Test concept",
-            "playstyle": "Test",
-            "memories": [{"name": "Mem1", "essences": ["Ess1"]}],
-            "constellation_tree": {"primary": "Destruction"},
-            "strengths": ["Strong"],
-            "weaknesses": ["Weak"],
-        }
-        result = validate_build_schema(build)
-        self.assertTrue(result.valid)
-        self.assertEqual(len(result.errors), 0)
+# (label, build, expected valid, substring expected in the warnings)
+_SCHEMA_CASES = (
+    ("valid", _VALID_BUILD, True, None),
+    ("missing required fields", {"name": "Test"}, False, None),
+    ("missing tree",
+     {k: v for k, v in _VALID_BUILD.items() if k != "constellation_tree"},
+     True, "tree"),
+)
 
-    def test_missing_required_fields(self):
-        build = {"name": "Test"}
-        result = validate_build_schema(build)
-        self.assertFalse(result.valid)
-        self.assertGreater(len(result.errors), 0)
 
-    def test_missing_tree_produces_warning(self):
-        build = {
-            "name": "Test",
-            "concept": "Test",
-            "playstyle": "Test",
-            "memories": [{"name": "M", "essences": ["E"]}],
-            "strengths": [],
-            "weaknesses": [],
-        }
-        result = validate_build_schema(build)
-        self.assertTrue(result.valid)
-        warning_texts = " ".join(result.warnings)
-        self.assertIn("tree", warning_texts.lower())
+class TestValidateBuildSchema(unittest.TestCase):
+    def test_schema_cases(self):
+        for label, build, valid, warn in _SCHEMA_CASES:
+            with self.subTest(label):
+                result = validate_build_schema(build)
+                self.assertIs(result.valid, valid)
+                self.assertEqual(not result.errors, valid)
+                if warn:
+                    self.assertTrue(any(warn in w.lower() for w in result.warnings),
+                                    result.warnings)
 
 
 class TestValidateFullBuild(unittest.TestCase):
     def test_valid_build_without_loader(self):
-        build = {
-            "name": "Test",
-            "concept": "Test",
-            "playstyle": "Test",
-            "memories": [{"name": "M", "essences": ["E1", "E2"]}],
-            "constellation_tree": {"primary": "Life"},
-            "strengths": ["S"],
-            "weaknesses": ["W"],
-        }
+        build = dict(_VALID_BUILD, constellation_tree={"primary": "Life"})
         result = validate_full_build(build)
         self.assertTrue(result.valid)
 
+    @unittest.skipUnless(_MIST_BUILDS, "no mist builds to check")
     def test_with_loader_reference_check(self):
-        loader = DataLoader()
-        builds = loader.builds_for("mist")
-        if builds:
-            result = validate_full_build(builds[0], loader)
-            # Real builds should pass basic validation
-            self.assertIsInstance(result.valid, bool)
+        result = validate_full_build(_MIST_BUILDS[0], LOADER)
+        # Real builds should pass basic validation
+        self.assertIsInstance(result.valid, bool)
 
 
 class TestValidateAllProjectBuilds(unittest.TestCase):
@@ -123,26 +108,28 @@ class TestValidateAllProjectBuilds(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.loader = DataLoader()
-
-    def test_all_builds_have_required_fields(self):
-        for char, builds in self.loader.builds.items():
-            for build in builds:
-                self.assertIn("name", build, f"Build missing 'name' in {char}")
-                self.assertIn("memories", build, f"Build '{build.get('name')}' missing memories in {char}")
-
-    def test_no_empty_essence_lists(self):
-        for char, builds in self.loader.builds.items():
-            for build in builds:
-                for memory in build.get("memories", []):
-                    essences = memory.get("essences", [])
-                    self.assertIsInstance(essences, list)
+        # Flat (character, build) pairs, materialized once for the class
+        cls._builds = tuple((char, build)
+                            for char, builds in LOADER.builds.items()
+                            for build in builds)
+
+    def test_all_builds_well_formed(self):
+        """Required fields and non-empty essence lists, in one pass."""
+        for char, build in self._builds:
+            name = build.get("name")
+            with self.subTest(char=char, build=name):
+                problems = [f"missing {field}" for field in ("name", "memories")
+                            if field not in build]
+                for memory in build.get("memories", ()):
+                    get = memory.get
+                    essences = get("essences", [])
+                    mem_name = get("name")
+                    if not isinstance(essences, list):
+                        problems.append(f"{mem_name}: essences not a list")
                     # Most memories should have essences
-                    if memory.get("name"):
-                        self.assertGreater(
-                            len(essences), 0,
-                            f"{char}/{build['name']}/{memory['name']} has no essences"
-                        )
+                    elif mem_name and not essences:
+                        problems.append(f"{mem_name}: has no essences")
+                self.assertFalse(problems, f"{char}/{name}: {problems}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,59 @@
+"""Tests for the view_builds CLI output formatting."""
+
+import io
+import json
+import sys
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import view_builds
+from view_builds import OutputFormatter
+
+_RECORDS = ({"name": "Flèche", "score": 3}, {"name": "Pure White", "score": 1})
+
+
+def _captured_flush(fmt: str) -> str:
+    out = OutputFormatter(fmt)
+    for record in _RECORDS:
+        out.collect(dict(record))
+    captured = io.StringIO()
+    with redirect_stdout(captured):
+        out.flush()
+    return captured.getvalue()
+
+
+class TestOutputFormatterJson(unittest.TestCase):
+    def test_json_to_text_only_stdout(self):
+        """A redirected (buffer-less) stdout still receives the JSON."""
+        text = _captured_flush("json")
+        self.assertEqual(json.loads(text), list(_RECORDS))
+        self.assertTrue(text.endswith("\n"))
+
+    @unittest.skipUnless(view_builds.orjson, "orjson not installed")
+    def test_orjson_and_stdlib_output_identical(self):
+        fast = _captured_flush("json")
+        with mock.patch.object(view_builds, "orjson", None):
+            stdlib = _captured_flush("json")
+        self.assertEqual(fast, stdlib)
+
+
+class TestOutputFormatterCsv(unittest.TestCase):
+    def test_csv_rows(self):
+        lines = _captured_flush("csv").splitlines()
+        self.assertEqual(lines[:3], ["name,score", "Flèche,3", "Pure White,1"])
+
+    def test_csv_rejects_keys_missing_from_first_record(self):
+        out = OutputFormatter("csv")
+        out.collect({"name": "A"})
+        out.collect({"name": "B", "extra": 1})
+        with redirect_stdout(io.StringIO()):
+            with self.assertRaises(ValueError):
+                out.flush()
+
+
+if __name__ == "__main__":
+    unittest.main()
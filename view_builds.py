@@ -25,21 +25,28 @@ Commands:
 
 import argparse
 import csv
-import io
 import json
 import sys
+import textwrap
+from collections import Counter, defaultdict
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any
+
+# Optional faster JSON encoder (pip install .[fast])
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Ensure analysis package is importable
 sys.path.insert(0, str(Path(__file__).parent))
 
-from analysis.data_loader import DataLoader, get_loader
+from analysis.data_loader import DataLoader, get_loader, write_json
 from analysis.validators import validate_no_duplicate_essences, validate_full_build
 from analysis.synergies import find_all_synergies_in_set, score_essence_set
-from analysis.build_comparator import BuildComparator
-from analysis.synergy_analyzer import SynergyAnalyzer
-from analysis.build_analyzer import BuildAnalyzer
+# The comparator/analyzer classes are imported by the commands that use
+# them, so --help and the listing commands skip loading them
 
 
 # -- Output Formatting --------------------------------------------------
@@ -72,23 +79,46 @@ class OutputFormatter:
     def flush(self):
         """Output all collected records in the chosen format."""
         if self.fmt == "json":
-            print(json.dumps(self._buffer, indent=2))
+            if orjson is not None:
+                payload = orjson.dumps(
+                    self._buffer,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+                buffer = getattr(sys.stdout, "buffer", None)
+                if buffer is not None:
+                    # Bytes go straight to the buffer; flush any text ahead
+                    sys.stdout.flush()
+                    buffer.write(payload)
+                else:
+                    # Text-only stdout (redirect_stdout, IDLE, test capture)
+                    sys.stdout.write(payload.decode())
+            else:
+                # Raw UTF-8 like the orjson branch, not \u escapes
+                print(json.dumps(self._buffer, indent=2, ensure_ascii=False))
         elif self.fmt == "csv" and self._buffer:
-            output = io.StringIO()
-            writer = csv.DictWriter(output, fieldnames=self._buffer[0].keys())
+            # Straight to stdout; DictWriter still rejects keys the first
+            # record doesn't have
+            writer = csv.DictWriter(sys.stdout, fieldnames=self._buffer[0].keys())
             writer.writeheader()
             writer.writerows(self._buffer)
-            print(output.getvalue())
+            print()
         self._buffer.clear()
 
 
 # -- Build Display ------------------------------------------------------
 
+def _memory_essences(build: Dict) -> FrozenSet[str]:
+    """Essences slotted in a build's memories, as the frozenset the
+    synergy scorers key their caches on (so they skip the conversion)."""
+    return frozenset(chain.from_iterable(
+        m.get("essences", ()) for m in build.get("memories", ())))
+
+
 def print_build_summary(
     build: Dict, char_name: str, loader: DataLoader, out: OutputFormatter
 ):
     """Print a concise summary of a build."""
     if out.fmt != "table":
+        rarity_of = loader.essence_rarity_map.get
         out.collect({
             "character": char_name,
             "name": build.get("name", "Unknown"),
@@ -98,7 +128,7 @@ def print_build_summary(
                 {
                     "name": m.get("name", ""),
                     "essences": [
-                        {"name": e, "rarity": loader.essence_rarity_map.get(e, "?")}
+                        {"name": e, "rarity": rarity_of(e, "?")}
                         for e in m.get("essences", [])
                     ],
                 }
@@ -130,10 +160,7 @@ def print_build_summary(
         print(f"Essence Rarity: {rarity_str}")
 
     # Synergy score
-    all_ess = set()
-    for m in build.get("memories", []):
-        all_ess.update(m.get("essences", []))
-    syn_score = score_essence_set(all_ess)
+    syn_score = score_essence_set(_memory_essences(build))
     if syn_score > 0:
         print(f"Synergy Score: {syn_score}")
 
@@ -178,6 +205,16 @@ def print_build_summary(
 
 # -- CLI Commands -------------------------------------------------------
 
+# Tags shown in the build overview when the build name contains any of
+# the keywords (case-sensitive), in display order
+_NAME_TAGS = (
+    ("BASIC ATK", ("Basic Attack",)),
+    ("MAX DMG", ("Maximum Damage", "Max Damage")),
+    ("AUTO", ("Automated", "Paranoia")),
+    ("SCALING", ("Divine", "Faith")),
+)
+
+
 def cmd_list(loader: DataLoader, out: OutputFormatter, **_):
     """List all builds with overview."""
     out.print_header("ALL CHARACTER BUILDS OVERVIEW")
@@ -190,17 +227,9 @@ def cmd_list(loader: DataLoader, out: OutputFormatter, **_):
         total += len(builds)
 
         for i, build in enumerate(builds, 1):
-            tags = []
             name = build.get("name", "")
-
-            if "Basic Attack" in name:
-                tags.append("BASIC ATK")
-            if "Maximum Damage" in name or "Max Damage" in name:
-                tags.append("MAX DMG")
-            if "Automated" in name or "Paranoia" in name:
-                tags.append("AUTO")
-            if "Divine" in name or "Faith" in name:
-                tags.append("SCALING")
+            tags = [tag for tag, keywords in _NAME_TAGS
+                    if any(kw in name for kw in keywords)]
 
             # Legendary count
             rarity = loader.count_rarity(build)
@@ -209,10 +238,7 @@ def cmd_list(loader: DataLoader, out: OutputFormatter, **_):
                 tags.append(f"{leg}L")
 
             # Synergy score
-            all_ess = set()
-            for m in build.get("memories", []):
-                all_ess.update(m.get("essences", []))
-            syn = score_essence_set(all_ess)
+            syn = score_essence_set(_memory_essences(build))
             if syn > 0:
                 tags.append(f"S:{syn}")
 
@@ -282,22 +308,17 @@ def cmd_build(loader: DataLoader, out: OutputFormatter, character: str, name: st
                 print("STRATEGY:")
                 out.print_separator()
                 strategy = build.get("strategy", "N/A")
-                words = strategy.split()
-                line = ""
-                for word in words:
-                    if len(line) + len(word) + 1 > 78:
-                        print(f"  {line}")
-                        line = word
-                    else:
-                        line = f"{line} {word}".strip()
-                if line:
-                    print(f"  {line}")
+                # Whole words only, up to 78 characters after the indent
+                wrapped = textwrap.fill(
+                    " ".join(strategy.split()), width=80,
+                    initial_indent="  ", subsequent_indent="  ",
+                    break_long_words=False, break_on_hyphens=False,
+                )
+                if wrapped:
+                    print(wrapped)
 
                 # Show synergy details
-                all_ess = set()
-                for m in build.get("memories", []):
-                    all_ess.update(m.get("essences", []))
-                synergies = find_all_synergies_in_set(all_ess)
+                synergies = find_all_synergies_in_set(_memory_essences(build))
                 if synergies:
                     print(f"\nActive Synergies:")
                     for s in synergies:
@@ -355,16 +376,15 @@ def cmd_synergy(loader: DataLoader, out: OutputFormatter, essence: str, **_):
     for char_name, builds in sorted(loader.builds.items()):
         for build in builds:
             for memory in build.get("memories", []):
-                matching = [
-                    e for e in memory.get("essences", [])
-                    if search_term in e.lower()
-                ]
+                # One lower() per essence, split into matched and the rest
+                matching, others = [], []
+                for e in memory.get("essences", []):
+                    (matching if search_term in e.lower() else others).append(e)
                 if matching:
                     if out.fmt == "table":
                         print(f"\n{char_name.upper()} - {build.get('name', 'Unknown')}")
                         print(f"  Memory: {memory.get('name', 'Unknown')}")
                         print(f"  Matched: {', '.join(matching)}")
-                        others = [e for e in memory.get("essences", []) if search_term not in e.lower()]
                         if others:
                             print(f"  Paired with: {', '.join(others)}")
                     else:
@@ -435,6 +455,7 @@ def cmd_validate(loader: DataLoader, out: OutputFormatter, **_):
 
 def cmd_compare(loader: DataLoader, out: OutputFormatter, character: str, **_):
     """Compare all builds for a character using analysis engine."""
+    from analysis.build_comparator import BuildComparator
     comparator = BuildComparator(loader)
     comparison = comparator.compare_builds(character)
 
@@ -482,6 +503,7 @@ def cmd_recommend(
     **_,
 ):
     """Get build recommendations for a character."""
+    from analysis.build_comparator import BuildComparator
     comparator = BuildComparator(loader)
     result = comparator.recommend_build(character, {
         "playstyle": playstyle,
@@ -520,6 +542,7 @@ def cmd_recommend(
 
 def cmd_stats(loader: DataLoader, out: OutputFormatter, **_):
     """Show project-wide statistics."""
+    from analysis.build_comparator import BuildComparator
     comparator = BuildComparator(loader)
     summary = comparator.get_all_builds_summary()
 
@@ -531,10 +554,7 @@ def cmd_stats(loader: DataLoader, out: OutputFormatter, **_):
     total_builds = summary["total_builds"]
 
     # Rarity distribution
-    rarity_dist: Dict[str, int] = {}
-    for e in loader.essences:
-        r = e.get("rarity", "Unknown")
-        rarity_dist[r] = rarity_dist.get(r, 0) + 1
+    rarity_dist = Counter(e.get("rarity", "Unknown") for e in loader.essences)
 
     if out.fmt == "table":
         print(f"\nCharacters: {total_characters}")
@@ -555,17 +575,11 @@ def cmd_stats(loader: DataLoader, out: OutputFormatter, **_):
             print(f"  {b['character'].capitalize()} - {b['build']} (Synergy: {b['synergy_score']}, {b['complexity']})")
 
         # Essence usage stats
-        essence_usage: Dict[str, int] = {}
-        for builds in loader.builds.values():
-            for build in builds:
-                for m in build.get("memories", []):
-                    for e in m.get("essences", []):
-                        essence_usage[e] = essence_usage.get(e, 0) + 1
+        essence_usage = loader.essence_usage_counts
 
         if essence_usage:
-            sorted_usage = sorted(essence_usage.items(), key=lambda x: x[1], reverse=True)
             print(f"\nMost Used Essences:")
-            for name, count in sorted_usage[:10]:
+            for name, count in essence_usage.most_common(10):
                 print(f"  {name}: used in {count} builds")
 
             unused = [e["name"] for e in loader.essences if e["name"] not in essence_usage]
@@ -581,7 +595,7 @@ def cmd_stats(loader: DataLoader, out: OutputFormatter, **_):
             "total_builds": total_builds,
             "total_essences": total_essences,
             "total_memories": total_memories,
-            "rarity_distribution": rarity_dist,
+            "rarity_distribution": dict(rarity_dist),
             "builds_per_character": {
                 k: v["build_count"] for k, v in summary["characters"].items()
             },
@@ -603,10 +617,9 @@ def cmd_essences(loader: DataLoader, out: OutputFormatter, rarity: Optional[str]
             return
 
     # Group by rarity
-    by_rarity: Dict[str, List[Dict]] = {}
+    by_rarity: Dict[str, List[Dict]] = defaultdict(list)
     for e in essences:
-        r = e.get("rarity", "Unknown")
-        by_rarity.setdefault(r, []).append(e)
+        by_rarity[e.get("rarity", "Unknown")].append(e)
 
     for r in ["Legendary", "Unique", "Epic", "Rare", "Common"]:
         group = by_rarity.get(r, [])
@@ -670,10 +683,9 @@ def cmd_memories(
         return
 
     # Group by type
-    by_type: Dict[str, List[Dict]] = {}
+    by_type: Dict[str, List[Dict]] = defaultdict(list)
     for m in memories:
-        t = m.get("type", "Unknown")
-        by_type.setdefault(t, []).append(m)
+        by_type[m.get("type", "Unknown")].append(m)
 
     for mem_type in sorted(by_type.keys()):
         group = by_type[mem_type]
@@ -700,6 +712,7 @@ def cmd_memories(
 
 def cmd_substitute(loader: DataLoader, out: OutputFormatter, essence: str, **_):
     """Find replacement essences for a given essence."""
+    from analysis.synergy_analyzer import SynergyAnalyzer
     analyzer = SynergyAnalyzer(loader)
     substitutes = analyzer.suggest_substitutes(essence)
 
@@ -736,26 +749,30 @@ def cmd_substitute(loader: DataLoader, out: OutputFormatter, essence: str, **_):
 
 def cmd_reindex(loader: DataLoader, out: OutputFormatter, **_):
     """Regenerate the build index file."""
-    index = {
-        "essence_usage": {},
-        "memory_usage": {},
-        "characters": {},
-    }
+    essence_usage: Dict[str, List[str]] = defaultdict(list)
+    memory_usage: Dict[str, List[str]] = defaultdict(list)
+    characters: Dict[str, List[str]] = {}
 
     for char_name, builds in loader.builds.items():
-        index["characters"][char_name] = [b.get("name", "") for b in builds]
+        characters[char_name] = [b.get("name", "") for b in builds]
         for build in builds:
             build_ref = f"{char_name}/{build.get('name', '')}"
             for memory in build.get("memories", []):
                 mem_name = memory.get("name", "")
                 if mem_name:
-                    index["memory_usage"].setdefault(mem_name, []).append(build_ref)
+                    memory_usage[mem_name].append(build_ref)
                 for ess in memory.get("essences", []):
-                    index["essence_usage"].setdefault(ess, []).append(build_ref)
+                    essence_usage[ess].append(build_ref)
+
+    index = {
+        "essence_usage": dict(essence_usage),
+        "memory_usage": dict(memory_usage),
+        "characters": characters,
+    }
 
     index_path = loader.builds_dir / "index.json"
-    with open(index_path, "w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2)
+    # Same writer as custom builds: orjson when installed, atomic rename
+    write_json(index_path, index)
 
     print(f"Build index written to {index_path}")
     print(f"  Essences tracked: {len(index['essence_usage'])}")
@@ -765,6 +782,7 @@ def cmd_reindex(loader: DataLoader, out: OutputFormatter, **_):
 
 def cmd_gaps(loader: DataLoader, out: OutputFormatter, character: str, **_):
     """Archetype gap analysis for a character."""
+    from analysis.build_analyzer import BuildAnalyzer
     analyzer = BuildAnalyzer(loader)
     result = analyzer.gap_analysis(character)
 
@@ -800,6 +818,7 @@ def cmd_scorecard(
     loader: DataLoader, out: OutputFormatter, character: str, name: str, **_
 ):
     """Detailed build scorecard with grade."""
+    from analysis.build_analyzer import BuildAnalyzer
     analyzer = BuildAnalyzer(loader)
     card = analyzer.build_scorecard(character, name)
 
@@ -848,8 +867,15 @@ def cmd_scorecard(
         out.flush()
 
 
+# Popular-essence row and its usage bar, one '#' per 5% of builds (capped
+# at 20: a build repeating an essence can push usage past 100%)
+_POPULAR_ROW = "  %-35s %3d builds (%.0f%%) %s"
+_USAGE_BARS = tuple("#" * i for i in range(21))
+
+
 def cmd_meta(loader: DataLoader, out: OutputFormatter, **_):
     """Essence meta-game report."""
+    from analysis.build_analyzer import BuildAnalyzer
     analyzer = BuildAnalyzer(loader)
     report = analyzer.essence_meta_report()
 
@@ -867,10 +893,10 @@ def cmd_meta(loader: DataLoader, out: OutputFormatter, **_):
             print(f"  {rarity}: {info['used']} essences, {info['total_uses']} total uses")
 
         print(f"\nMost Popular Essences:")
+        total_builds = report["total_builds"]
         for name, count in report["most_used"][:10]:
-            pct = count / report["total_builds"] * 100
-            bar = "#" * int(pct / 5)
-            print(f"  {name:<35} {count:>3} builds ({pct:.0f}%) {bar}")
+            pct = count / total_builds * 100
+            print(_POPULAR_ROW % (name, count, pct, _USAGE_BARS[min(int(pct / 5), 20)]))
 
         if report["least_used"]:
             print(f"\nRarely Used (1-2 builds):")
@@ -879,9 +905,9 @@ def cmd_meta(loader: DataLoader, out: OutputFormatter, **_):
 
         if report["unused_essences"]:
             print(f"\nCompletely Unused Essences:")
+            rarity_of = loader.essence_rarity_map.get
             for name in report["unused_essences"]:
-                rarity = loader.essence_rarity_map.get(name, "?")
-                print(f"  [{rarity[0]}] {name}")
+                print(f"  [{rarity_of(name, '?')[0]}] {name}")
 
         print(f"\nMost Common Essence Pairs:")
         for item in report["most_common_pairs"]:
@@ -920,34 +946,42 @@ def build_parser() -> argparse.ArgumentParser:
     sub = parser.add_subparsers(dest="command", help="Available commands")
 
     # list
-    sub.add_parser("list", help="List all builds overview")
+    p = sub.add_parser("list", help="List all builds overview")
+    p.set_defaults(func=cmd_list)
 
     # character
     p = sub.add_parser("character", help="Show all builds for a character")
+    p.set_defaults(func=cmd_character)
     p.add_argument("character", help="Character name")
 
     # build
     p = sub.add_parser("build", help="Show detailed build info")
+    p.set_defaults(func=cmd_build)
     p.add_argument("character", help="Character name")
     p.add_argument("name", nargs="+", help="Build name (partial match)")
 
     # search
     p = sub.add_parser("search", help="Search builds by keyword")
+    p.set_defaults(func=cmd_search)
     p.add_argument("query", nargs="+", help="Search query")
 
     # synergy
     p = sub.add_parser("synergy", help="Find builds using a specific essence")
+    p.set_defaults(func=cmd_synergy)
     p.add_argument("essence", nargs="+", help="Essence name (partial match)")
 
     # validate
-    sub.add_parser("validate", help="Validate all builds")
+    p = sub.add_parser("validate", help="Validate all builds")
+    p.set_defaults(func=cmd_validate)
 
     # compare
     p = sub.add_parser("compare", help="Compare builds for a character")
+    p.set_defaults(func=cmd_compare)
     p.add_argument("character", help="Character name")
 
     # recommend
     p = sub.add_parser("recommend", help="Get build recommendations")
+    p.set_defaults(func=cmd_recommend)
     p.add_argument("character", help="Character name")
     p.add_argument("--playstyle", "-p", default="aggressive",
                    choices=["aggressive", "defensive", "support", "mobile", "automated"],
@@ -960,60 +994,48 @@ def build_parser() -> argparse.ArgumentParser:
                    help="Preferred complexity")
 
     # stats
-    sub.add_parser("stats", help="Show project statistics")
+    p = sub.add_parser("stats", help="Show project statistics")
+    p.set_defaults(func=cmd_stats)
 
     # essences
     p = sub.add_parser("essences", help="Browse essences catalog")
+    p.set_defaults(func=cmd_essences)
     p.add_argument("--rarity", "-r", help="Filter by rarity")
 
     # memories
     p = sub.add_parser("memories", help="Browse memories catalog")
+    p.set_defaults(func=cmd_memories)
     p.add_argument("--character", "-c", help="Filter by character builds")
 
     # substitute
     p = sub.add_parser("substitute", help="Find essence replacements")
+    p.set_defaults(func=cmd_substitute)
     p.add_argument("essence", nargs="+", help="Essence name")
 
     # gaps
     p = sub.add_parser("gaps", help="Archetype gap analysis for a character")
+    p.set_defaults(func=cmd_gaps)
     p.add_argument("character", help="Character name")
 
     # scorecard
     p = sub.add_parser("scorecard", help="Detailed build scorecard with grade")
+    p.set_defaults(func=cmd_scorecard)
     p.add_argument("character", help="Character name")
     p.add_argument("name", nargs="+", help="Build name (partial match)")
 
     # meta
-    sub.add_parser("meta", help="Essence meta-game report")
+    p = sub.add_parser("meta", help="Essence meta-game report")
+    p.set_defaults(func=cmd_meta)
 
     # reindex
-    sub.add_parser("reindex", help="Regenerate the build index")
+    p = sub.add_parser("reindex", help="Regenerate the build index")
+    p.set_defaults(func=cmd_reindex)
 
     return parser
 
 
 # -- Main ---------------------------------------------------------------
 
-COMMANDS = {
-    "list": cmd_list,
-    "character": cmd_character,
-    "build": cmd_build,
-    "search": cmd_search,
-    "synergy": cmd_synergy,
-    "validate": cmd_validate,
-    "compare": cmd_compare,
-    "recommend": cmd_recommend,
-    "stats": cmd_stats,
-    "essences": cmd_essences,
-    "memories": cmd_memories,
-    "substitute": cmd_substitute,
-    "gaps": cmd_gaps,
-    "scorecard": cmd_scorecard,
-    "meta": cmd_meta,
-    "reindex": cmd_reindex,
-}
-
-
 def main():
     parser = build_parser()
     args = parser.parse_args()
@@ -1025,24 +1047,19 @@ def main():
     loader = get_loader()
     out = OutputFormatter(args.format)
 
-    # Convert args to dict for command dispatch
-    kwargs = vars(args)
-    command = kwargs.pop("command")
-    kwargs.pop("format")
-
-    # Join multi-word arguments
-    if "name" in kwargs and isinstance(kwargs["name"], list):
-        kwargs["name"] = " ".join(kwargs["name"])
-    if "query" in kwargs and isinstance(kwargs["query"], list):
-        kwargs["query"] = " ".join(kwargs["query"])
-    if "essence" in kwargs and isinstance(kwargs["essence"], list):
-        kwargs["essence"] = " ".join(kwargs["essence"])
-
-    cmd_fn = COMMANDS.get(command)
-    if cmd_fn:
-        cmd_fn(loader=loader, out=out, **kwargs)
-    else:
-        parser.print_help()
+    # Everything but the dispatch fields goes to the handler; multi-word
+    # (nargs="+") arguments arrive as lists and are joined back up
+    kwargs = {
+        key: " ".join(value) if isinstance(value, list) else value
+        for key, value in vars(args).items()
+        if key not in ("command", "format", "func")
+    }
+
+    # Table output is hundreds of print() calls; on a terminal stdout is
+    # line buffered (one write per line), so block-buffer it instead
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    args.func(loader=loader, out=out, **kwargs)
 
 
 if __name__ == "__main__":